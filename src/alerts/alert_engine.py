@@ -1,7 +1,13 @@
 """アラートエンジン"""
-from datetime import datetime, timedelta, timezone
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import timezone
 from typing import Optional
 
+import numpy as np
 from loguru import logger
 
 from alerts.conditions import ConditionChecker
@@ -9,11 +15,139 @@ from database.db_manager import DatabaseManager
 from notifications.notification_manager import NotificationManager
 
 
+# 条件タイプごとの評価コスト順（安い順）。履歴参照を伴う
+# price_change_percent は単純比較の後に評価する。
+_CONDITION_COST = {
+    "price_below": 0,
+    "price_above": 0,
+    "volume_above": 1,
+    "price_change_percent": 2,
+}
+
+
+@dataclass(slots=True)
+class CompiledCondition:
+    """init時にプリコンパイルされたアラート条件
+
+    閾値はfloatへ事前キャストし、評価関数は条件タイプごとの
+    クロージャに解決済み。ホットループは fn(price, size, market) を
+    呼ぶだけで (成立したか, トリガー値) が返る。
+    """
+
+    type: str
+    threshold: float
+    fn: object  # (price, size, market) -> tuple[bool, float]
+
+
+def _compile_condition_fn(
+    checker: ConditionChecker,
+    cond_type: str,
+    threshold: float,
+    timeframe_minutes: int,
+):
+    """条件タイプごとの評価クロージャを生成"""
+    if cond_type == "price_below":
+        check = checker.check_price_below
+
+        def fn(price, size, market):
+            return check(price, threshold), price
+
+    elif cond_type == "price_above":
+        check = checker.check_price_above
+
+        def fn(price, size, market):
+            return check(price, threshold), price
+
+    elif cond_type == "price_change_percent":
+        check = checker.check_price_change_percent
+
+        def fn(price, size, market):
+            if not market:
+                return False, price
+            return (
+                check(
+                    market=market,
+                    current_price=price,
+                    timeframe_minutes=timeframe_minutes,
+                    threshold_percent=threshold,
+                ),
+                price,
+            )
+
+    elif cond_type == "volume_above":
+        check = checker.check_volume_above
+
+        def fn(price, size, market):
+            if size is None:
+                return False, price
+            return check(size, threshold), size
+
+    else:
+        return None
+
+    return fn
+
+
+@dataclass(slots=True)
+class CompiledAlert:
+    """init時にプリコンパイルされたアラートルール"""
+
+    name: str
+    match_mode: str
+    cooldown_minutes: int
+    conditions: list[CompiledCondition] = field(default_factory=list)
+    # 条件タイプ -> 閾値（発火時のO(1)参照用）
+    thresholds: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class AlertBucket:
+    """market_idごとのルールバケット
+
+    単一のprice_below/price_above条件だけのルールは閾値をNumPy配列に
+    まとめ、1回のベクトル比較で成立ルールを抽出する。それ以外は
+    generalとして従来の逐次評価にかける。
+    """
+
+    general: list[CompiledAlert] = field(default_factory=list)
+    below_alerts: list[CompiledAlert] = field(default_factory=list)
+    below_thresholds: Optional[np.ndarray] = None
+    above_alerts: list[CompiledAlert] = field(default_factory=list)
+    above_thresholds: Optional[np.ndarray] = None
+
+    def add(self, alert: CompiledAlert):
+        conds = alert.conditions
+        if len(conds) == 1 and conds[0].type == "price_below":
+            self.below_alerts.append(alert)
+        elif len(conds) == 1 and conds[0].type == "price_above":
+            self.above_alerts.append(alert)
+        else:
+            self.general.append(alert)
+
+    def finalize(self):
+        """閾値配列を確定（compile完了時に1度だけ呼ぶ）"""
+        if self.below_alerts:
+            self.below_thresholds = np.array(
+                [a.conditions[0].threshold for a in self.below_alerts]
+            )
+        if self.above_alerts:
+            self.above_thresholds = np.array(
+                [a.conditions[0].threshold for a in self.above_alerts]
+            )
+
+    def __bool__(self):
+        return bool(self.general or self.below_alerts or self.above_alerts)
+
+
 class AlertEngine:
     """アラート評価エンジン
 
     alerts.yamlの定義に基づき、価格イベントを受信するたびに
     条件をチェックし、成立時にアラートを発火する。
+
+    ルールはinit時にCompiledAlertへ変換し、market_id別の
+    dictへバケット化する。イベントごとの評価は該当マーケットの
+    ルール + ワイルドカードルールのみを走査する。
     """
 
     def __init__(
@@ -22,11 +156,76 @@ class AlertEngine:
         db_manager: DatabaseManager,
         notification_manager: NotificationManager,
     ):
-        self.alerts = alerts_config.get("alerts", [])
         self.db = db_manager
         self.notifier = notification_manager
         self.condition_checker = ConditionChecker(db_manager)
-        logger.info(f"アラートエンジン初期化: {len(self.alerts)} 件のアラート")
+        # アラート名 -> クールダウン期限（epoch秒）。起動後はDBを参照しない
+        self._cooldown_until: dict[str, float] = {}
+        # SQLiteのシングルライターを保つため書き込みは1スレッドに集約
+        self._db_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="alert-db"
+        )
+
+        # market_id -> ルールバケット / ワイルドカードバケット
+        self._by_market: dict[str, AlertBucket] = {}
+        self._wildcard = AlertBucket()
+        self._alert_count = 0
+        self._compile(alerts_config.get("alerts", []))
+
+        logger.info(f"アラートエンジン初期化: {self._alert_count} 件のアラート")
+
+    def _compile(self, alerts: list):
+        """alerts.yamlのルール定義をCompiledAlertへ変換してバケット化"""
+        checker = self.condition_checker
+
+        max_timeframe = 0
+        for alert in alerts:
+            compiled_conditions = []
+            for cond in alert.get("conditions", []):
+                cond_type = cond.get("type")
+                if cond_type == "price_change_percent":
+                    threshold = float(cond.get("threshold_percent", 0.0))
+                else:
+                    threshold = float(cond.get("threshold", 0.0))
+                timeframe_minutes = int(cond.get("timeframe_minutes", 5))
+
+                fn = _compile_condition_fn(
+                    checker, cond_type, threshold, timeframe_minutes
+                )
+                if fn is None:
+                    logger.warning(
+                        f"未知の条件タイプをスキップ: {cond_type} "
+                        f"(alert={alert.get('name')})"
+                    )
+                    continue
+                if cond_type == "price_change_percent":
+                    max_timeframe = max(max_timeframe, timeframe_minutes)
+                compiled_conditions.append(
+                    CompiledCondition(type=cond_type, threshold=threshold, fn=fn)
+                )
+
+            compiled_conditions.sort(key=lambda c: _CONDITION_COST[c.type])
+            compiled = CompiledAlert(
+                name=alert.get("name", "unnamed"),
+                match_mode=alert.get("match_mode", "match_any"),
+                cooldown_minutes=alert.get("cooldown_minutes", 10),
+                conditions=compiled_conditions,
+                thresholds={c.type: c.threshold for c in compiled_conditions},
+            )
+
+            market_id = alert.get("market_id", "*")
+            if market_id == "*":
+                self._wildcard.add(compiled)
+            else:
+                self._by_market.setdefault(market_id, AlertBucket()).add(compiled)
+            self._alert_count += 1
+
+        self._wildcard.finalize()
+        for bucket in self._by_market.values():
+            bucket.finalize()
+
+        if max_timeframe > 0:
+            checker.configure_history(max_timeframe)
 
     async def check_alerts(
         self,
@@ -35,128 +234,129 @@ class AlertEngine:
         price: float,
         size: Optional[float] = None,
     ):
-        """全アラートルールを評価"""
-        for alert in self.alerts:
-            alert_market_id = alert.get("market_id", "*")
+        """該当マーケットのアラートルールを評価"""
+        market_bucket = self._by_market.get(market) if market else None
 
-            # マーケットマッチング
-            if alert_market_id != "*" and alert_market_id != market:
+        for bucket in (market_bucket, self._wildcard):
+            if not bucket:
                 continue
 
-            try:
-                await self._evaluate_alert(alert, asset_id, market, price, size)
-            except Exception as e:
-                logger.error(f"アラート評価エラー ({alert.get('name')}): {e}")
+            # 単一閾値ルールはベクトル比較でまとめて判定
+            if bucket.below_alerts:
+                for idx in np.nonzero(price < bucket.below_thresholds)[0]:
+                    alert = bucket.below_alerts[idx]
+                    try:
+                        await self._fire_matched(
+                            alert, "price_below", asset_id, market, price
+                        )
+                    except Exception as e:
+                        logger.error(f"アラート評価エラー ({alert.name}): {e}")
+
+            if bucket.above_alerts:
+                for idx in np.nonzero(price > bucket.above_thresholds)[0]:
+                    alert = bucket.above_alerts[idx]
+                    try:
+                        await self._fire_matched(
+                            alert, "price_above", asset_id, market, price
+                        )
+                    except Exception as e:
+                        logger.error(f"アラート評価エラー ({alert.name}): {e}")
+
+            for alert in bucket.general:
+                try:
+                    await self._evaluate_alert(alert, asset_id, market, price, size)
+                except Exception as e:
+                    logger.error(f"アラート評価エラー ({alert.name}): {e}")
+
+    async def _fire_matched(
+        self,
+        alert: CompiledAlert,
+        condition_type: str,
+        asset_id: str,
+        market: Optional[str],
+        price: float,
+    ):
+        """条件成立済みルールをクールダウン確認のうえ発火"""
+        if self._is_in_cooldown(alert.name, alert.cooldown_minutes):
+            return
+        await self._trigger_alert(
+            alert_name=alert.name,
+            asset_id=asset_id,
+            market=market,
+            condition_type=condition_type,
+            threshold=alert.thresholds.get(condition_type, 0.0),
+            current_value=price,
+            price=price,
+            cooldown_minutes=alert.cooldown_minutes,
+        )
 
     async def _evaluate_alert(
         self,
-        alert: dict,
+        alert: CompiledAlert,
         asset_id: str,
         market: Optional[str],
         price: float,
         size: Optional[float],
     ):
         """個別アラートルールを評価"""
-        alert_name = alert.get("name", "unnamed")
-        match_mode = alert.get("match_mode", "match_any")
-        cooldown_minutes = alert.get("cooldown_minutes", 10)
-        conditions = alert.get("conditions", [])
-
-        if not conditions:
+        if not alert.conditions:
             return
 
         # クールダウンチェック
-        if self._is_in_cooldown(alert_name, cooldown_minutes):
+        if self._is_in_cooldown(alert.name, alert.cooldown_minutes):
             return
 
-        # 条件評価
-        results = []
+        # 条件評価（match_anyは初成立で打ち切り、match_allは初不成立で棄却）
+        match_any = alert.match_mode != "match_all"
         triggered_condition = None
         triggered_value = None
 
-        for cond in conditions:
-            cond_type = cond.get("type")
-            matched = False
-
-            if cond_type == "price_below":
-                matched = self.condition_checker.check_price_below(
-                    price, cond["threshold"]
-                )
-                if matched:
-                    triggered_condition = cond_type
-                    triggered_value = price
-
-            elif cond_type == "price_above":
-                matched = self.condition_checker.check_price_above(
-                    price, cond["threshold"]
-                )
-                if matched:
-                    triggered_condition = cond_type
-                    triggered_value = price
-
-            elif cond_type == "price_change_percent":
-                if market:
-                    matched = self.condition_checker.check_price_change_percent(
-                        market=market,
-                        current_price=price,
-                        timeframe_minutes=cond.get("timeframe_minutes", 5),
-                        threshold_percent=cond["threshold_percent"],
-                    )
-                    if matched:
-                        triggered_condition = cond_type
-                        triggered_value = price
-
-            elif cond_type == "volume_above":
-                if size is not None:
-                    matched = self.condition_checker.check_volume_above(
-                        size, cond["threshold"]
-                    )
-                    if matched:
-                        triggered_condition = cond_type
-                        triggered_value = size
+        for cond in alert.conditions:
+            matched, value = cond.fn(price, size, market)
 
-            results.append(matched)
+            if matched:
+                if triggered_condition is None:
+                    triggered_condition = cond.type
+                    triggered_value = value
+                if match_any:
+                    break
+            elif not match_any:
+                # match_all: 1つでも不成立なら発火しない
+                return
 
-        # match_mode に基づき判定
-        if match_mode == "match_all":
-            should_trigger = all(results) and any(results)
-        else:  # match_any
-            should_trigger = any(results)
-
-        if should_trigger and triggered_condition is not None:
-            # トリガーした条件の threshold を取得
-            threshold = self._get_threshold(conditions, triggered_condition)
+        if triggered_condition is not None:
+            threshold = alert.thresholds.get(triggered_condition, 0.0)
             await self._trigger_alert(
-                alert_name=alert_name,
+                alert_name=alert.name,
                 asset_id=asset_id,
                 market=market,
                 condition_type=triggered_condition,
                 threshold=threshold,
                 current_value=triggered_value,
                 price=price,
+                cooldown_minutes=alert.cooldown_minutes,
             )
 
-    def _get_threshold(self, conditions: list, condition_type: str) -> float:
-        """条件リストから該当条件の閾値を取得"""
-        for cond in conditions:
-            if cond.get("type") == condition_type:
-                if condition_type == "price_change_percent":
-                    return cond.get("threshold_percent", 0.0)
-                return cond.get("threshold", 0.0)
-        return 0.0
-
     def _is_in_cooldown(self, alert_name: str, cooldown_minutes: int) -> bool:
-        """クールダウン期間内かチェック"""
-        last_time = self.db.get_last_alert_time(alert_name)
-        if last_time is None:
-            return False
+        """クールダウン期間内かチェック
 
-        # naive datetime の場合 UTC として扱う
-        if last_time.tzinfo is None:
-            last_time = last_time.replace(tzinfo=timezone.utc)
+        期限はepoch秒のfloatとしてメモリ上のキャッシュで管理し、
+        DBへは初回参照時（プロセス再起動直後）のみ問い合わせる。
+        ホットパスはfloat比較のみでdatetime演算を行わない。
+        """
+        deadline = self._cooldown_until.get(alert_name)
+        if deadline is None:
+            last_time = self.db.get_last_alert_time(alert_name)
+            if last_time is None:
+                deadline = 0.0
+            else:
+                # naive datetime の場合 UTC として扱う
+                if last_time.tzinfo is None:
+                    last_time = last_time.replace(tzinfo=timezone.utc)
+                deadline = last_time.timestamp() + cooldown_minutes * 60
+            self._cooldown_until[alert_name] = deadline
 
-        cooldown_until = last_time + timedelta(minutes=cooldown_minutes)
-        return datetime.now(timezone.utc) < cooldown_until
+        return time.time() < deadline
 
     async def _trigger_alert(
         self,
@@ -167,6 +367,7 @@ class AlertEngine:
         threshold: float,
         current_value: float,
         price: float,
+        cooldown_minutes: int = 0,
     ):
         """アラートを発火: DB保存 + 通知送信"""
         message = (
@@ -175,15 +376,21 @@ class AlertEngine:
         )
         logger.warning(f"[ALERT] {message} | asset={asset_id[:16]}...")
 
-        # DB保存
-        alert_log_id = self.db.save_alert_log(
-            alert_name=alert_name,
-            asset_id=asset_id,
-            condition_type=condition_type,
-            threshold=threshold,
-            current_value=current_value,
-            message=message,
+        # DB保存（イベントループをブロックしないようexecutorで実行）
+        loop = asyncio.get_running_loop()
+        alert_log_id = await loop.run_in_executor(
+            self._db_executor,
+            functools.partial(
+                self.db.save_alert_log,
+                alert_name=alert_name,
+                asset_id=asset_id,
+                condition_type=condition_type,
+                threshold=threshold,
+                current_value=current_value,
+                message=message,
+            ),
         )
+        self._cooldown_until[alert_name] = time.time() + cooldown_minutes * 60
 
         # 通知送信
         market_name = market or asset_id[:16]
@@ -1,4 +1,6 @@
 """PriceMonitor用アラートハンドラー"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
@@ -7,6 +9,10 @@ from loguru import logger
 from alerts.alert_engine import AlertEngine
 from database.db_manager import DatabaseManager
 
+# バッチ書き込みの上限件数 / 最大待機件数
+_FLUSH_BATCH_SIZE = 500
+_QUEUE_MAXSIZE = 10000
+
 
 def _safe_float(value: Any) -> Optional[float]:
     """文字列や数値を安全にfloatに変換"""
@@ -18,23 +24,45 @@ def _safe_float(value: Any) -> Optional[float]:
         return None
 
 
+def _from_unix(ts: float) -> Optional[datetime]:
+    """Unix timestamp（秒またはミリ秒）をdatetimeに変換"""
+    if ts > 1e12:
+        ts = ts / 1000
+    try:
+        return datetime.fromtimestamp(ts, tz=timezone.utc)
+    except (ValueError, OSError, OverflowError):
+        return None
+
+
 def _parse_timestamp(value: Any) -> Optional[datetime]:
-    """タイムスタンプを安全にdatetimeに変換"""
+    """タイムスタンプを安全にdatetimeに変換
+
+    型で一度だけ分岐し、既知のフォーマット（Unix ms / ISO-8601）を
+    文字列加工なしの直行パスで処理する。
+    """
     if value is None:
         return None
     if isinstance(value, datetime):
         return value
+    if isinstance(value, (int, float)):
+        return _from_unix(value)
+
+    s = value if isinstance(value, str) else str(value)
+
+    # Unix timestamp の数字文字列（CLOB WSはミリ秒のことが多い）
+    if s.isdigit():
+        return _from_unix(float(s))
+
+    # ISO形式（Zサフィックスはスライスで処理。replace不要）
     try:
-        # ISO形式
-        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
-    except (ValueError, TypeError):
+        if s.endswith("Z"):
+            return datetime.fromisoformat(s[:-1]).replace(tzinfo=timezone.utc)
+        return datetime.fromisoformat(s)
+    except ValueError:
         pass
+
     try:
-        # Unix timestamp (ミリ秒)
-        ts = float(value)
-        if ts > 1e12:
-            ts = ts / 1000
-        return datetime.fromtimestamp(ts, tz=timezone.utc)
+        return _from_unix(float(s))
     except (ValueError, TypeError):
         return None
 
@@ -43,6 +71,8 @@ class AlertHandler:
     """PriceMonitorのadd_handlerに登録するハンドラー
 
     price_changeイベントを受信し、DB保存とアラート評価を行う。
+    DB保存はイベントごとのINSERTではなく、asyncio.Queue経由で
+    バックグラウンドタスクがバッチでフラッシュする。
     """
 
     def __init__(
@@ -52,6 +82,61 @@ class AlertHandler:
     ):
         self.db = db_manager
         self.alert_engine = alert_engine
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
+        self._flush_task: Optional[asyncio.Task] = None
+        # SQLiteのシングルライターを保つため書き込みは1スレッドに集約
+        self._db_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="price-db"
+        )
+
+    def _ensure_flush_task(self):
+        """フラッシュタスクを起動（イベントループ上で初回呼び出し時）"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self):
+        """キューから価格データを取り出してバッチでDBに書き込む"""
+        while True:
+            rows = [await self._queue.get()]
+            while len(rows) < _FLUSH_BATCH_SIZE:
+                try:
+                    rows.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            await self._flush_rows(rows)
+
+    def _flush_sync(self, rows: list) -> int:
+        """タイムスタンプ解析込みで1バッチを書き込む（ライタースレッド上）"""
+        for row in rows:
+            row["timestamp"] = _parse_timestamp(row["timestamp"])
+        return self.db.save_prices_bulk(rows)
+
+    async def _flush_rows(self, rows: list):
+        """1バッチをexecutor経由で書き込み（SQLiteは同期API）"""
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._db_executor, self._flush_sync, rows)
+        except Exception as e:
+            logger.error(f"価格データDB保存エラー: {e}")
+
+    async def close(self):
+        """フラッシュタスクを停止し、残りのキューを書き込む"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        rows = []
+        while True:
+            try:
+                rows.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        if rows:
+            await self._flush_rows(rows)
 
     async def handle_event(self, event_type: str, data: Dict[str, Any]):
         """PriceMonitorから呼ばれるイベントハンドラー
@@ -72,25 +157,28 @@ class AlertHandler:
         size = _safe_float(data.get("size"))
         best_bid = _safe_float(data.get("best_bid"))
         best_ask = _safe_float(data.get("best_ask"))
-        timestamp = _parse_timestamp(data.get("timestamp"))
 
-        # DB保存
+        # DB保存（キューに積むだけ。実際の書き込みはバッチフラッシュ。
+        # タイムスタンプ解析もライタースレッド側で行う）
+        self._ensure_flush_task()
         try:
-            self.db.save_price(
-                asset_id=asset_id,
-                market=market,
-                price=price,
-                size=size,
-                side=data.get("side"),
-                best_bid=best_bid,
-                best_ask=best_ask,
-                timestamp=timestamp,
-            )
-        except Exception as e:
-            logger.error(f"価格データDB保存エラー: {e}")
-
-        # アラート評価
+            self._queue.put_nowait({
+                "asset_id": asset_id,
+                "market": market,
+                "price": price,
+                "size": size,
+                "side": data.get("side"),
+                "best_bid": best_bid,
+                "best_ask": best_ask,
+                "timestamp": data.get("timestamp"),
+            })
+        except asyncio.QueueFull:
+            logger.warning("価格書き込みキューが満杯のためイベントを破棄")
+
+        # アラート評価（リングバッファは受信時刻で記録）
         if price is not None:
+            if market:
+                self.alert_engine.condition_checker.record(market, price)
             try:
                 await self.alert_engine.check_alerts(
                     asset_id=asset_id,
@@ -1,14 +1,43 @@
 """アラート条件チェッカー"""
-from loguru import logger
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 from database.db_manager import DatabaseManager
 
+# リングバッファ容量の算出に使う1分あたりの想定最大イベント数
+_EVENTS_PER_MINUTE_CAP = 600
+
 
 class ConditionChecker:
-    """各種アラート条件を評価するクラス"""
+    """各種アラート条件を評価するクラス
+
+    price_change_percent用の価格履歴はマーケットごとのリングバッファ
+    （deque）で保持する。AlertHandlerが全価格イベントをrecord()で
+    供給するため、評価時のDBクエリは起動直後のコールドスタート時のみ。
+    """
 
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
+        # market -> (timestamp, price) のリングバッファ
+        self._history: dict[str, deque] = {}
+        self._history_maxlen = 5 * _EVENTS_PER_MINUTE_CAP
+        self._max_timeframe_minutes = 5
+        # DBからシード済みのマーケット（コールドスタート時の1回のみ）
+        self._db_seeded: set[str] = set()
+
+    def configure_history(self, max_timeframe_minutes: int):
+        """設定中ルールの最大タイムフレームからバッファ容量を決める"""
+        self._max_timeframe_minutes = max(1, max_timeframe_minutes)
+        self._history_maxlen = self._max_timeframe_minutes * _EVENTS_PER_MINUTE_CAP
+
+    def record(self, market: str, price: float, timestamp: Optional[datetime] = None):
+        """価格イベントをリングバッファに記録"""
+        dq = self._history.get(market)
+        if dq is None:
+            dq = deque(maxlen=self._history_maxlen)
+            self._history[market] = dq
+        dq.append((timestamp or datetime.now(timezone.utc), price))
 
     def check_price_below(self, current_price: float, threshold: float) -> bool:
         """価格が閾値を下回っているか"""
@@ -29,11 +58,15 @@ class ConditionChecker:
 
         threshold_percent が正の場合は上昇率、負の場合は下落率をチェック。
         """
-        history = self.db.get_price_history(market=market, minutes=timeframe_minutes)
-        if not history:
+        oldest_price = self._oldest_price_in_window(market, timeframe_minutes)
+        if oldest_price is None and market not in self._db_seeded:
+            # コールドスタート: 最大タイムフレーム分を1回だけDBから取得して
+            # リングバッファにシードする（全ルールで共有）
+            self._seed_from_db(market)
+            oldest_price = self._oldest_price_in_window(market, timeframe_minutes)
+        if oldest_price is None:
             return False
 
-        oldest_price = history[0].price
         if not oldest_price or oldest_price == 0:
             return False
 
@@ -44,6 +77,55 @@ class ConditionChecker:
         else:
             return change_percent <= threshold_percent
 
+    def _seed_from_db(self, market: str):
+        """リングバッファを最大タイムフレーム分のDB履歴で初期化"""
+        self._db_seeded.add(market)
+        timeframe = max(self._max_timeframe_minutes, 5)
+        history = self.db.get_price_history(market=market, minutes=timeframe)
+        if not history:
+            return
+        dq = self._history.get(market)
+        existing = list(dq) if dq else []
+        dq = deque(maxlen=self._history_maxlen)
+        for row in history:
+            if row.price is not None:
+                dq.append((row.timestamp, row.price))
+        dq.extend(existing)
+        self._history[market] = dq
+
+    def _oldest_price_in_window(
+        self, market: str, timeframe_minutes: int
+    ) -> Optional[float]:
+        """リングバッファから期間内の最古の価格を取得
+
+        バッファは同一マーケットの全ルールで共有しているため、破棄は
+        最大タイムフレーム基準でのみ行う（短いルールの評価で長いルールが
+        必要とする履歴を捨てない）。呼び出しごとの窓頭は破棄せずに
+        左から走査して求める。
+        """
+        dq = self._history.get(market)
+        if not dq:
+            return None
+
+        now = datetime.now(timezone.utc)
+        max_cutoff = now - timedelta(minutes=self._max_timeframe_minutes)
+        while dq:
+            ts = dq[0][0]
+            if ts.tzinfo is None:
+                ts = ts.replace(tzinfo=timezone.utc)
+            if ts < max_cutoff:
+                dq.popleft()
+            else:
+                break
+
+        cutoff = now - timedelta(minutes=timeframe_minutes)
+        for ts, price in dq:
+            if ts.tzinfo is None:
+                ts = ts.replace(tzinfo=timezone.utc)
+            if ts >= cutoff:
+                return price
+        return None
+
     def check_volume_above(self, current_volume: float, threshold: float) -> bool:
         """取引量が閾値を上回っているか"""
         return current_volume > threshold
@@ -1,7 +1,9 @@
 """Polymarket API クライアント"""
+import asyncio
 from typing import Any, Dict, List, Optional
 
 import aiohttp
+import orjson
 from loguru import logger
 from py_clob_client.client import ClobClient
 
@@ -37,9 +39,21 @@ class PolymarketClient:
         logger.info("Polymarket クライアント初期化完了")
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """aiohttp セッションを取得（遅延初期化）"""
+        """aiohttp セッションを取得（遅延初期化）
+
+        コネクションプール・DNSキャッシュ・圧縮ネゴシエーションを
+        設定し、TLS/DNSコストをリクエスト間で償却する。
+        """
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                ),
+                headers={"Accept-Encoding": "gzip, br"},
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
         return self._session
 
     async def check_connection(self) -> bool:
@@ -56,12 +70,29 @@ class PolymarketClient:
         """サーバー時刻を取得"""
         try:
             time = self.clob_client.get_server_time()
-            logger.debug(f"サーバー時刻: {time}")
+            logger.opt(lazy=True).debug("サーバー時刻: {t}", t=lambda: time)
             return time
         except Exception as e:
             logger.error(f"サーバー時刻取得失敗: {e}")
             return None
 
+    @staticmethod
+    def _normalize_market(m: Dict[str, Any]) -> Dict[str, Any]:
+        """Gammaレスポンスのマーケット dict を正規化
+
+        clobTokenIds / outcomePrices は JSON 文字列で返ることがあるため、
+        レスポンスのデコード時に1回だけパースしてリストへ置き換える。
+        後段（アクティブ判定・トークンID抽出）の再パースが不要になる。
+        """
+        for key in ("clobTokenIds", "outcomePrices"):
+            value = m.get(key)
+            if isinstance(value, str):
+                try:
+                    m[key] = orjson.loads(value)
+                except orjson.JSONDecodeError:
+                    pass
+        return m
+
     async def get_markets_from_gamma(
         self,
         active: bool = True,
@@ -94,9 +125,9 @@ class PolymarketClient:
                 f"{GAMMA_HOST}/markets", params=params
             ) as response:
                 if response.status == 200:
-                    markets = await response.json()
+                    markets = orjson.loads(await response.read())
                     logger.info(f"Gamma API: {len(markets)}件のマーケット取得")
-                    return markets
+                    return [self._normalize_market(m) for m in markets]
                 else:
                     logger.error(
                         f"Gamma API エラー: status={response.status}"
@@ -125,9 +156,9 @@ class PolymarketClient:
                 f"{GAMMA_HOST}/markets", params=params
             ) as response:
                 if response.status == 200:
-                    markets = await response.json()
+                    markets = orjson.loads(await response.read())
                     if markets:
-                        market = markets[0]
+                        market = self._normalize_market(markets[0])
                         logger.info(
                             f"マーケット情報取得成功: {market.get('question', 'N/A')}"
                         )
@@ -146,6 +177,50 @@ class PolymarketClient:
             logger.error(f"マーケット情報取得エラー: {e}")
             return None
 
+    async def get_markets_by_condition_ids(
+        self, condition_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Gamma APIから複数のcondition IDのマーケット情報を一括取得
+
+        condition_ids= はカンマ区切りで複数指定できるため、
+        1マーケット1リクエストのN+1を1リクエストにまとめる。
+
+        Args:
+            condition_ids: マーケットのcondition IDのリスト
+
+        Returns:
+            Dict: condition_id をキーにしたマーケット情報の辞書
+                  （見つからなかったIDはキー自体が存在しない）
+        """
+        if not condition_ids:
+            return {}
+        try:
+            session = await self._get_session()
+            params = {"condition_ids": ",".join(condition_ids)}
+            async with session.get(
+                f"{GAMMA_HOST}/markets", params=params
+            ) as response:
+                if response.status == 200:
+                    markets = orjson.loads(await response.read())
+                    logger.info(
+                        f"Gamma API: {len(markets)}/{len(condition_ids)}件の"
+                        "マーケットを一括取得"
+                    )
+                    return {
+                        m["conditionId"]: self._normalize_market(m)
+                        for m in markets
+                        if m.get("conditionId")
+                    }
+                else:
+                    logger.error(
+                        f"Gamma API エラー: status={response.status}"
+                    )
+                    return {}
+        except Exception as e:
+            logger.error(f"マーケット一括取得エラー: {e}")
+            return {}
+
     async def get_orderbook(self, token_id: str) -> Optional[Dict[str, Any]]:
         """
         CLOB APIからオーダーブックを取得
@@ -159,7 +234,9 @@ class PolymarketClient:
         try:
             orderbook = self.clob_client.get_order_book(token_id)
             if orderbook:
-                logger.debug(f"オーダーブック取得: token_id={token_id}")
+                logger.opt(lazy=True).debug(
+                    "オーダーブック取得: token_id={t}", t=lambda: token_id
+                )
                 return orderbook
             else:
                 logger.warning(f"オーダーブックが見つかりません: {token_id}")
@@ -179,10 +256,19 @@ class PolymarketClient:
             float: ミッドポイント価格
         """
         try:
-            midpoint = self.clob_client.get_midpoint(token_id)
+            # clob_client は同期（requests ベース）なのでワーカースレッドで
+            # 実行する。そうしないと gather で束ねても直列のままになる
+            loop = asyncio.get_running_loop()
+            midpoint = await loop.run_in_executor(
+                None, self.clob_client.get_midpoint, token_id
+            )
             if midpoint:
                 price = float(midpoint.get("mid", 0))
-                logger.debug(f"ミッドポイント: token_id={token_id}, price={price}")
+                logger.opt(lazy=True).debug(
+                    "ミッドポイント: token_id={t}, price={p}",
+                    t=lambda: token_id,
+                    p=lambda: price,
+                )
                 return price
             return None
         except Exception as e:
@@ -203,8 +289,10 @@ class PolymarketClient:
             result = self.clob_client.get_last_trade_price(token_id)
             if result:
                 price = float(result.get("price", 0))
-                logger.debug(
-                    f"最終取引価格: token_id={token_id}, price={price}"
+                logger.opt(lazy=True).debug(
+                    "最終取引価格: token_id={t}, price={p}",
+                    t=lambda: token_id,
+                    p=lambda: price,
                 )
                 return price
             return None
@@ -1,8 +1,9 @@
 """WebSocket クライアント（Polymarket CLOB WebSocket対応）"""
 import asyncio
-import json
+import random
 from typing import Callable, List, Optional
 
+import orjson
 import websockets
 from loguru import logger
 
@@ -11,6 +12,8 @@ class WebSocketClient:
     """Polymarket CLOB WebSocket クライアント"""
 
     PING_INTERVAL = 10  # Polymarket要件: 10秒ごとにPING送信
+    MAX_RECONNECT_DELAY = 60  # バックオフの上限（秒）
+    SUBSCRIBE_CHUNK_SIZE = 200  # 1フレームあたりの購読アセット数上限
 
     def __init__(
         self,
@@ -37,12 +40,16 @@ class WebSocketClient:
         self.is_running = False
         self.reconnect_count = 0
         self._ping_task: Optional[asyncio.Task] = None
-        self._subscribed_assets: List[str] = []
+        self._subscribed_assets: set[str] = set()
+        # 現在の購読セットのシリアライズ済みフレーム群（再接続時に再利用）
+        self._subscribe_frames: List[str] = []
 
     async def connect(self):
         """WebSocket接続を確立"""
         try:
-            self.websocket = await websockets.connect(self.ws_url)
+            # Polymarketはアプリケーション層のテキストPINGを要求するため、
+            # ライブラリのプロトコルレベルpingは無効化して二重送信を避ける
+            self.websocket = await websockets.connect(self.ws_url, ping_interval=None)
             self.is_running = True
             self.reconnect_count = 0
 
@@ -66,19 +73,31 @@ class WebSocketClient:
             logger.error("WebSocketが接続されていません")
             return
 
-        # 初回購読メッセージ
-        subscribe_msg = {
-            "assets_ids": asset_ids,
-            "type": "market",
-        }
-
         try:
-            await self.websocket.send(json.dumps(subscribe_msg))
-            self._subscribed_assets.extend(asset_ids)
-            logger.info(f"マーケット購読開始: {asset_ids}")
+            for frame in self._build_frames(asset_ids):
+                await self.websocket.send(frame)
+            self._subscribed_assets.update(asset_ids)
+            self._subscribe_frames = self._build_frames(sorted(self._subscribed_assets))
+            logger.info(f"マーケット購読開始: {len(asset_ids)} アセット")
         except Exception as e:
             logger.error(f"購読メッセージ送信失敗: {e}")
 
+    def _build_frames(self, asset_ids: List[str]) -> List[str]:
+        """アセットIDをチャンク分割してシリアライズ済みフレームを生成
+
+        巨大な単一フレームによるヘッドオブライン・ブロッキングを避ける。
+        bytes のまま送ると BINARY フレームになってしまうため、
+        エンドポイントが期待するテキストJSONに decode しておく。
+        """
+        chunk = self.SUBSCRIBE_CHUNK_SIZE
+        return [
+            orjson.dumps({
+                "assets_ids": asset_ids[i:i + chunk],
+                "type": "market",
+            }).decode()
+            for i in range(0, len(asset_ids), chunk)
+        ]
+
     async def unsubscribe_from_market(self, asset_ids: List[str]):
         """
         マーケットの購読を解除
@@ -95,10 +114,9 @@ class WebSocketClient:
         }
 
         try:
-            await self.websocket.send(json.dumps(unsubscribe_msg))
-            for aid in asset_ids:
-                if aid in self._subscribed_assets:
-                    self._subscribed_assets.remove(aid)
+            await self.websocket.send(orjson.dumps(unsubscribe_msg).decode())
+            self._subscribed_assets.difference_update(asset_ids)
+            self._subscribe_frames = self._build_frames(sorted(self._subscribed_assets))
             logger.info(f"マーケット購読解除: {asset_ids}")
         except Exception as e:
             logger.error(f"購読解除メッセージ送信失敗: {e}")
@@ -106,6 +124,7 @@ class WebSocketClient:
     async def listen(self):
         """メッセージ受信ループ"""
         while self.is_running:
+            message = None
             try:
                 if not self.websocket:
                     await self._reconnect()
@@ -117,31 +136,52 @@ class WebSocketClient:
                 if message == "PONG":
                     continue
 
-                data = json.loads(message)
-                logger.debug(f"WS受信: {str(message)[:300]}")
+                data = orjson.loads(message)
+                # DEBUG無効時にスライス/str変換コストを払わない
+                logger.opt(lazy=True).debug(
+                    "WS受信: {m}", m=lambda: str(message)[:300]
+                )
 
-                # コールバック関数を実行
+                # コールバックには常に list[dict] を渡す（受信側の
+                # フレームごとの型チェックをなくすための正規化）
+                if type(data) is not list:
+                    data = [data]
                 await self.on_message(data)
 
             except websockets.exceptions.ConnectionClosed:
                 logger.warning("WebSocket接続が切断されました")
                 await self._reconnect()
 
-            except json.JSONDecodeError as e:
-                logger.warning(f"JSONパースエラー: {e}, message={message[:100]}")
+            except orjson.JSONDecodeError as e:
+                # except 節の e はブロック終了時に解放されるため、lambda で
+                # 直接閉じ込めず別名のローカルに写してから渡す
+                err = str(e)
+                logger.opt(lazy=True).warning(
+                    "JSONパースエラー: {e}, message={m}",
+                    e=lambda: err,
+                    m=lambda: str(message)[:100],
+                )
 
             except Exception as e:
                 logger.error(f"メッセージ受信エラー: {e}")
                 await asyncio.sleep(1)
 
     async def _ping_loop(self):
-        """定期的にPINGを送信してWebSocket接続を維持"""
+        """定期的にPINGを送信してWebSocket接続を維持
+
+        Polymarket CLOB はテキストの "PING" を要求するため
+        アプリケーション層で送信する。送信時間に依存しない
+        デッドライン方式でドリフトを防ぐ。
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.PING_INTERVAL
         while self.is_running:
             try:
                 if self.websocket:
                     await self.websocket.send("PING")
                     logger.debug("PING送信")
-                await asyncio.sleep(self.PING_INTERVAL)
+                await asyncio.sleep(max(0.0, deadline - loop.time()))
+                deadline += self.PING_INTERVAL
             except websockets.exceptions.ConnectionClosed:
                 logger.warning("PING送信中にWebSocket接続が切断されました")
                 break
@@ -159,18 +199,27 @@ class WebSocketClient:
             return
 
         self.reconnect_count += 1
+
+        # 指数バックオフ + ジッター（再接続の同期集中を避ける）
+        delay = min(
+            self.MAX_RECONNECT_DELAY,
+            self.reconnect_delay * (2 ** (self.reconnect_count - 1)),
+        ) * random.uniform(0.5, 1.5)
         logger.info(
-            f"再接続試行 {self.reconnect_count}/{self.max_reconnect_attempts}"
+            f"再接続試行 {self.reconnect_count}/{self.max_reconnect_attempts} "
+            f"({delay:.1f}秒後)"
         )
 
-        await asyncio.sleep(self.reconnect_delay)
+        await asyncio.sleep(delay)
 
         try:
             await self.connect()
 
-            # 再購読
-            if self._subscribed_assets:
-                await self.subscribe_to_market(self._subscribed_assets)
+            # 再購読（キャッシュ済みフレームをそのまま送信）
+            if self._subscribe_frames:
+                for frame in self._subscribe_frames:
+                    await self.websocket.send(frame)
+                logger.info(f"再購読完了: {len(self._subscribed_assets)} アセット")
 
         except Exception as e:
             logger.error(f"再接続失敗: {e}")
@@ -2,30 +2,422 @@
 
 calculate_signal(data) を各ティックで呼び出し、シミュレーション実行する。
 PositionManager の P&L 式と OrderExecutor のスリッページ計算をインメモリで再現。
+
+ティックデータは内部的に Structure-of-Arrays（TickArrays）へ変換し、
+dict ハッシュではなく NumPy 配列のインデックスアクセスで走査する。
 """
-from collections import deque
-from typing import Any, Callable, Optional
+import math
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Union
 
+import numpy as np
 from loguru import logger
 
+from utils._njit import HAS_NUMBA, njit
+
+
+@njit(cache=True)
+def _buy_update(
+    pos_size: np.ndarray,
+    pos_avg: np.ndarray,
+    code: int,
+    exec_price: float,
+    amount_usdc: float,
+):
+    """BUY をポジション配列へ反映（PositionManager BUY と同一式。
+    丸めはレコード出力時まで遅延）"""
+    size = pos_size[code]
+    if size <= 0.0:
+        pos_size[code] = amount_usdc
+        pos_avg[code] = exec_price
+    else:
+        total = size + amount_usdc
+        pos_avg[code] = (pos_avg[code] * size + exec_price * amount_usdc) / total
+        pos_size[code] = total
+
+
+@njit(cache=True)
+def _sell_update(
+    pos_size: np.ndarray,
+    pos_avg: np.ndarray,
+    code: int,
+    exec_price: float,
+    amount_usdc: float,
+):
+    """SELL をポジション配列へ反映（PositionManager SELL と同一式）
+
+    Returns:
+        (成立したか, 売却USDC, 実現損益)
+    """
+    size = pos_size[code]
+    if size <= 0.0:
+        return False, 0.0, 0.0
+
+    sell_usdc = min(amount_usdc, size)
+
+    realized_pnl = 0.0
+    avg = pos_avg[code]
+    if avg > 0.0:
+        realized_pnl = sell_usdc * (exec_price - avg) / avg
+
+    remaining = size - sell_usdc
+    if remaining <= 0.001:
+        pos_size[code] = 0.0
+        pos_avg[code] = 0.0
+    else:
+        pos_size[code] = remaining
+
+    return True, sell_usdc, realized_pnl
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True)
+    def _equity_kernel(
+        capital: float,
+        pos_size: np.ndarray,
+        pos_avg: np.ndarray,
+        last_prices: np.ndarray,
+    ) -> float:
+        """現在のエクイティ（資金 + 未実現含み益/損）を計算
+
+        手動ループだが numba が SIMD 化する。
+        """
+        equity = capital
+        for code in range(pos_size.shape[0]):
+            size = pos_size[code]
+            avg = pos_avg[code]
+            if size <= 0.0 or avg <= 0.0:
+                continue
+            price = last_prices[code]
+            if np.isnan(price):
+                price = avg
+            equity += size * price / avg
+        return equity
+
+else:
+
+    def _equity_kernel(
+        capital: float,
+        pos_size: np.ndarray,
+        pos_avg: np.ndarray,
+        last_prices: np.ndarray,
+    ) -> float:
+        """現在のエクイティ（資金 + 未実現含み益/損）を計算
+
+        numba 未導入時はアセットループを NumPy のベクトル演算で実行。
+        """
+        valid = (pos_size > 0.0) & (pos_avg > 0.0)
+        prices = np.where(np.isnan(last_prices), pos_avg, last_prices)
+        safe_avg = np.where(valid, pos_avg, 1.0)
+        equity = capital + float(
+            np.sum(np.where(valid, pos_size * prices / safe_avg, 0.0))
+        )
+        return equity
+
+
+@njit(cache=True)
+def _precompute_exec_prices(
+    action_arr: np.ndarray,
+    price_arr: np.ndarray,
+    bid_arr: np.ndarray,
+    ask_arr: np.ndarray,
+    use_book_price: bool,
+    slip: float,
+) -> np.ndarray:
+    """全ティックの約定価格をブランチレスな前段パスで一括計算
+
+    符号ベクトル方式: base * (1 + sign * slip)。分岐は述語化され
+    LLVM がループを SIMD 化できる。
+    """
+    n = price_arr.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        is_buy = action_arr[i] == 1
+        sign = 1.0 if is_buy else -1.0
+        base = price_arr[i]
+        if use_book_price:
+            book = ask_arr[i] if is_buy else bid_arr[i]
+            if not np.isnan(book):
+                base = book
+        out[i] = base * (1.0 + sign * slip)
+    return out
+
+
+@njit(cache=True)
+def _run_kernel(
+    price_arr: np.ndarray,
+    exec_arr: np.ndarray,
+    code_arr: np.ndarray,
+    action_arr: np.ndarray,
+    amount_arr: np.ndarray,
+    n_assets: int,
+    initial_capital: float,
+):
+    """全ティックループを単一カーネルで実行（ベクトル化可能戦略用）
+
+    action_arr: 0=HOLD, 1=BUY, 2=SELL（ティックごとに事前計算済み）
+    exec_arr: _precompute_exec_prices による事前計算済み約定価格
+    Returns:
+        (capital, pos_size, pos_avg, trade_count,
+         trade_tick, trade_action, trade_code, trade_price,
+         trade_amount, trade_pnl, equity_arr, capital_arr)
+    """
+    n = price_arr.shape[0]
+    capital = initial_capital
+    pos_size = np.zeros(n_assets, dtype=np.float64)
+    pos_avg = np.zeros(n_assets, dtype=np.float64)
+    last_prices = np.full(n_assets, np.nan, dtype=np.float64)
+
+    # トレードバッファ（強制クローズ分を含めて確保、末尾でトリム）
+    max_trades = n + n_assets
+    trade_tick = np.empty(max_trades, dtype=np.int64)
+    trade_action = np.empty(max_trades, dtype=np.int8)
+    trade_code = np.empty(max_trades, dtype=np.int32)
+    trade_price = np.empty(max_trades, dtype=np.float64)
+    trade_amount = np.empty(max_trades, dtype=np.float64)
+    trade_pnl = np.empty(max_trades, dtype=np.float64)
+    trade_count = 0
+
+    equity_arr = np.empty(n, dtype=np.float64)
+    capital_arr = np.empty(n, dtype=np.float64)
+
+    for i in range(n):
+        code = code_arr[i]
+        price = price_arr[i]
+        last_prices[code] = price
+        action = action_arr[i]
+        amount = amount_arr[i]
+
+        if action == 1 and amount > 0.0 and amount <= capital:
+            exec_price = exec_arr[i]
+            _buy_update(pos_size, pos_avg, code, exec_price, amount)
+            capital -= amount
+            trade_tick[trade_count] = i
+            trade_action[trade_count] = 1
+            trade_code[trade_count] = code
+            trade_price[trade_count] = exec_price
+            trade_amount[trade_count] = amount
+            trade_pnl[trade_count] = 0.0
+            trade_count += 1
+
+        elif action == 2 and amount > 0.0:
+            exec_price = exec_arr[i]
+            ok, sell_usdc, realized_pnl = _sell_update(
+                pos_size, pos_avg, code, exec_price, amount
+            )
+            if ok:
+                capital += sell_usdc + realized_pnl
+                trade_tick[trade_count] = i
+                trade_action[trade_count] = 2
+                trade_code[trade_count] = code
+                trade_price[trade_count] = exec_price
+                trade_amount[trade_count] = sell_usdc
+                trade_pnl[trade_count] = realized_pnl
+                trade_count += 1
+
+        equity_arr[i] = _equity_kernel(capital, pos_size, pos_avg, last_prices)
+        capital_arr[i] = capital
+
+    # 未決済ポジションを最終価格で強制クローズ（tick=-1で記録）
+    for code in range(n_assets):
+        if pos_size[code] <= 0.0:
+            continue
+        close_price = last_prices[code]
+        if np.isnan(close_price):
+            close_price = pos_avg[code]
+        ok, sell_usdc, realized_pnl = _sell_update(
+            pos_size, pos_avg, code, close_price, pos_size[code]
+        )
+        if ok:
+            capital += sell_usdc + realized_pnl
+            trade_tick[trade_count] = -1
+            trade_action[trade_count] = 2
+            trade_code[trade_count] = code
+            trade_price[trade_count] = close_price
+            trade_amount[trade_count] = sell_usdc
+            trade_pnl[trade_count] = realized_pnl
+            trade_count += 1
+
+    return (
+        capital,
+        pos_size,
+        pos_avg,
+        trade_count,
+        trade_tick,
+        trade_action,
+        trade_code,
+        trade_price,
+        trade_amount,
+        trade_pnl,
+        equity_arr,
+        capital_arr,
+    )
+
+
+@dataclass(slots=True)
+class TickArrays:
+    """SoA形式のティックデータ
+
+    asset_id / market は整数コードにインターンし、数値列は
+    float64 配列（欠損は NaN）として保持する。
+    """
+
+    price: np.ndarray  # float64
+    best_bid: np.ndarray  # float64（欠損は NaN）
+    best_ask: np.ndarray  # float64（欠損は NaN）
+    asset_codes: np.ndarray  # int32
+    market_codes: np.ndarray  # int32
+    timestamps: list
+    assets: list  # コード -> asset_id
+    markets: list  # コード -> market
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    def sort_by_timestamp(self) -> "TickArrays":
+        """timestamp 昇順に全カラムを並べ替える（インプレース）
+
+        Python の list.sort（要素ごとの比較 + lambda 呼び出し）ではなく、
+        NumPy の argsort でソート順を一度求めてファンシーインデックスで
+        各カラムへ適用する。ISO-8601 文字列は辞書順 = 時系列順。
+        """
+        if len(self.price) == 0:
+            return self
+
+        order = np.argsort(np.asarray(self.timestamps), kind="stable")
+        self.price = self.price[order]
+        self.best_bid = self.best_bid[order]
+        self.best_ask = self.best_ask[order]
+        self.asset_codes = self.asset_codes[order]
+        self.market_codes = self.market_codes[order]
+        self.timestamps = [self.timestamps[i] for i in order]
+        return self
+
+    @classmethod
+    def from_ticks(cls, ticks: list[dict]) -> "TickArrays":
+        """list[dict] のティックデータをSoAへ変換
+
+        price が欠損、または asset_id が空の行はスキップする。
+        """
+        prices: list[float] = []
+        bids: list[float] = []
+        asks: list[float] = []
+        asset_codes: list[int] = []
+        market_codes: list[int] = []
+        timestamps: list = []
+        asset_table: dict[str, int] = {}
+        market_table: dict[str, int] = {}
+
+        for tick in ticks:
+            asset_id = tick.get("asset_id", "")
+            price = tick.get("price")
+            if price is None or asset_id == "":
+                continue
 
-class _Position:
-    """インメモリ軽量ポジション"""
-    __slots__ = ("asset_id", "market", "side", "size_usdc", "average_price")
+            code = asset_table.setdefault(asset_id, len(asset_table))
+            market = tick.get("market", "") or ""
+            market_code = market_table.setdefault(market, len(market_table))
+
+            bid = tick.get("best_bid")
+            ask = tick.get("best_ask")
+            prices.append(float(price))
+            bids.append(float(bid) if bid is not None else math.nan)
+            asks.append(float(ask) if ask is not None else math.nan)
+            asset_codes.append(code)
+            market_codes.append(market_code)
+            timestamps.append(tick.get("timestamp", ""))
+
+        return cls(
+            price=np.asarray(prices, dtype=np.float64),
+            best_bid=np.asarray(bids, dtype=np.float64),
+            best_ask=np.asarray(asks, dtype=np.float64),
+            asset_codes=np.asarray(asset_codes, dtype=np.int32),
+            market_codes=np.asarray(market_codes, dtype=np.int32),
+            timestamps=timestamps,
+            assets=list(asset_table),
+            markets=list(market_table),
+        )
+
+
+class _HistoryView:
+    """リングバッファ上の遅延履歴ビュー
+
+    list[{price, timestamp}] と同じ読み取りインターフェース
+    （len / インデックス / イテレーション）を、コピーなしで提供する。
+    dict は参照されたエントリに対してのみ生成される。
+    """
+
+    __slots__ = ("_prices", "_timestamps", "_head", "_length", "_maxlen")
 
     def __init__(
         self,
-        asset_id: str,
-        market: str,
-        side: str = "BUY",
-        size_usdc: float = 0.0,
-        average_price: float = 0.0,
+        prices: np.ndarray,
+        timestamps: list,
+        head: int,
+        maxlen: int,
     ):
-        self.asset_id = asset_id
-        self.market = market
-        self.side = side
-        self.size_usdc = size_usdc
-        self.average_price = average_price
+        self._prices = prices
+        self._timestamps = timestamps
+        self._head = head
+        self._length = min(head, maxlen)
+        self._maxlen = maxlen
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("history index out of range")
+        pos = (self._head - self._length + index) % self._maxlen
+        return {
+            "price": self._prices[pos],
+            "timestamp": self._timestamps[pos],
+        }
+
+    def __iter__(self):
+        for i in range(self._length):
+            yield self[i]
+
+
+class HistoryBuffers:
+    """アセットごとの価格履歴リングバッファ
+
+    deque of dict の代わりに事前確保した NumPy 配列へ書き込み、
+    ティックごとのリストコピーと小オブジェクト生成を排除する。
+    ビューは次の append まで再利用される。
+    """
+
+    def __init__(self, n_assets: int, maxlen: int = 100):
+        self._maxlen = maxlen
+        self._prices = np.empty((n_assets, maxlen), dtype=np.float64)
+        self._timestamps = [[""] * maxlen for _ in range(n_assets)]
+        self._heads = np.zeros(n_assets, dtype=np.int64)
+        self._views: list = [None] * n_assets
+
+    def append(self, code: int, price: float, timestamp) -> None:
+        pos = self._heads[code] % self._maxlen
+        self._prices[code, pos] = price
+        self._timestamps[code][pos] = timestamp
+        self._heads[code] += 1
+        self._views[code] = None
+
+    def get_view(self, code: int) -> _HistoryView:
+        view = self._views[code]
+        if view is None:
+            view = _HistoryView(
+                self._prices[code],
+                self._timestamps[code],
+                int(self._heads[code]),
+                self._maxlen,
+            )
+            self._views[code] = view
+        return view
 
 
 class BacktestEngine:
@@ -37,6 +429,11 @@ class BacktestEngine:
         slippage_config: スリッページ設定 dict
             - use_book_price: bool (default True)
             - slippage_bps: float (default 0)
+        equity_stride: エクイティカーブの記録間隔（ティック数）。
+            1 で全ティック記録（既定）。分析・描画はティック解像度を
+            要求しないため、長期バックテストでは 100 程度に粗くすると
+            メモリとエクイティ計算コストが stride 分の1になる。
+            最終ティックは常に記録される。
     """
 
     def __init__(
@@ -44,50 +441,85 @@ class BacktestEngine:
         calculate_signal: Callable[[dict], dict],
         initial_capital: float = 10000.0,
         slippage_config: Optional[dict] = None,
+        equity_stride: int = 1,
     ):
         self._calculate_signal = calculate_signal
         self._initial_capital = initial_capital
+        self._equity_stride = max(1, equity_stride)
 
         config = slippage_config or {}
         self._use_book_price = config.get("use_book_price", True)
         self._slippage_bps = config.get("slippage_bps", 0)
 
-    def run(self, ticks: list[dict]) -> dict:
+    def run(self, ticks: Union[list[dict], TickArrays]) -> dict:
         """バックテスト実行
 
+        注意: calculate_signal へ渡す data dict はティック間で再利用される
+        （毎ティックの dict 生成を避けるため）。戦略側で dict 自体への
+        参照をティックをまたいで保持してはならない。
+
         Args:
             ticks: timestamp 昇順のティックデータ
+                （list[dict] または DataFetcher が生成する TickArrays）
 
         Returns:
             {trades, equity_curve, final_capital, positions, initial_capital}
         """
+        arrays = ticks if isinstance(ticks, TickArrays) else TickArrays.from_ticks(ticks)
+
+        # 再利用するシグナルデータバッファ（_build_signal_data が上書き）
+        signal_buf: dict = {
+            "price": 0.0,
+            "market_id": "",
+            "history": None,
+            "position_usdc": 0.0,
+            "side": None,
+            "best_bid": None,
+            "best_ask": None,
+            "timestamp": None,
+        }
+
+        n_assets = len(arrays.assets)
         capital = self._initial_capital
-        positions: dict[str, _Position] = {}
         trades: list[dict] = []
         equity_curve: list[dict] = []
-        history_buffers: dict[str, deque] = {}
-        last_prices: dict[str, float] = {}
-
-        for tick in ticks:
-            asset_id = tick.get("asset_id", "")
-            price = tick.get("price")
-            if price is None or asset_id == "":
-                continue
-
-            price = float(price)
-            last_prices[asset_id] = price
+        history_buffers = HistoryBuffers(n_assets)
+        last_prices = np.full(n_assets, np.nan, dtype=np.float64)
+        # ポジション状態はアセットコードでインデックスするSoA配列
+        pos_size = np.zeros(n_assets, dtype=np.float64)
+        pos_avg = np.zeros(n_assets, dtype=np.float64)
+        pos_opened = np.zeros(n_assets, dtype=np.bool_)
+
+        price_arr = arrays.price
+        bid_arr = arrays.best_bid
+        ask_arr = arrays.best_ask
+        code_arr = arrays.asset_codes
+        market_codes = arrays.market_codes
+        timestamps = arrays.timestamps
+        markets = arrays.markets
+        stride = self._equity_stride
+        last_index = len(price_arr) - 1
+
+        for i in range(len(price_arr)):
+            code = code_arr[i]
+            price = price_arr[i]
+            timestamp = timestamps[i]
+            last_prices[code] = price
 
             # history_buffer 更新
-            if asset_id not in history_buffers:
-                history_buffers[asset_id] = deque(maxlen=100)
-            history_buffers[asset_id].append({
-                "price": price,
-                "timestamp": tick.get("timestamp", ""),
-            })
+            history_buffers.append(code, price, timestamp)
 
-            # signal_data 構築
+            # signal_data 構築（バッファを上書き再利用）
             signal_data = self._build_signal_data(
-                tick, asset_id, price, positions, history_buffers
+                signal_buf,
+                price=price,
+                market=markets[market_codes[i]],
+                best_bid=bid_arr[i],
+                best_ask=ask_arr[i],
+                timestamp=timestamp,
+                position_usdc=pos_size[code],
+                side="BUY" if pos_opened[code] else None,
+                history=history_buffers.get_view(code),
             )
 
             # シグナル計算
@@ -102,72 +534,74 @@ class BacktestEngine:
 
             action = signal.get("action", "HOLD")
             amount = signal.get("amount", 0)
+            # 戦略は同じ reason 文字列を繰り返し返すことが多い。
+            # intern で重複インスタンスを1つに畳み、トレード数百万件時の
+            # 文字列ヒープ肥大を防ぐ。
             reason = signal.get("reason", "")
+            if type(reason) is str:
+                reason = sys.intern(reason)
 
             if action == "BUY" and amount > 0 and amount <= capital:
                 exec_price = self._calc_execution_price(
-                    "BUY", price, tick.get("best_bid"), tick.get("best_ask")
+                    "BUY", price, bid_arr[i], ask_arr[i]
                 )
-                result = self._process_buy(
-                    asset_id, tick.get("market", ""), exec_price,
-                    amount, capital, positions,
-                )
-                if result is not None:
-                    capital = result["capital"]
-                    trades.append({
-                        "action": "BUY",
-                        "asset_id": asset_id,
-                        "price": exec_price,
-                        "amount_usdc": result["amount_usdc"],
-                        "realized_pnl": 0.0,
-                        "reason": reason,
-                        "timestamp": tick.get("timestamp", ""),
-                    })
+                _buy_update(pos_size, pos_avg, code, exec_price, float(amount))
+                pos_opened[code] = True
+                capital -= amount
+                trades.append({
+                    "action": "BUY",
+                    "asset_id": arrays.assets[code],
+                    "price": round(exec_price, 6),
+                    "amount_usdc": amount,
+                    "realized_pnl": 0.0,
+                    "reason": reason,
+                    "timestamp": timestamp,
+                })
 
             elif action == "SELL" and amount > 0:
                 exec_price = self._calc_execution_price(
-                    "SELL", price, tick.get("best_bid"), tick.get("best_ask")
+                    "SELL", price, bid_arr[i], ask_arr[i]
                 )
-                result = self._process_sell(
-                    asset_id, exec_price, amount, capital, positions,
+                ok, sell_usdc, realized_pnl = _sell_update(
+                    pos_size, pos_avg, code, exec_price, float(amount)
                 )
-                if result is not None:
-                    capital = result["capital"]
+                if ok:
+                    capital += sell_usdc + realized_pnl
                     trades.append({
                         "action": "SELL",
-                        "asset_id": asset_id,
-                        "price": exec_price,
-                        "amount_usdc": result["sell_usdc"],
-                        "realized_pnl": result["realized_pnl"],
+                        "asset_id": arrays.assets[code],
+                        "price": round(exec_price, 6),
+                        "amount_usdc": round(sell_usdc, 6),
+                        "realized_pnl": round(realized_pnl, 6),
                         "reason": reason,
-                        "timestamp": tick.get("timestamp", ""),
+                        "timestamp": timestamp,
                     })
 
-            # エクイティ記録
-            equity = self._calc_equity(capital, positions, last_prices)
-            equity_curve.append({
-                "timestamp": tick.get("timestamp", ""),
-                "equity": equity,
-                "capital": capital,
-            })
+            # エクイティ記録（stride 間隔 + 最終ティック）
+            if i % stride == 0 or i == last_index:
+                equity = _equity_kernel(capital, pos_size, pos_avg, last_prices)
+                equity_curve.append({
+                    "timestamp": timestamp,
+                    "equity": equity,
+                    "capital": capital,
+                })
 
         # 未決済ポジションを最終価格で強制クローズ
-        for asset_id in list(positions.keys()):
-            pos = positions[asset_id]
-            if pos.size_usdc <= 0:
-                continue
-            close_price = last_prices.get(asset_id, pos.average_price)
-            result = self._process_sell(
-                asset_id, close_price, pos.size_usdc, capital, positions,
+        for code in np.where(pos_size > 0)[0]:
+            close_price = last_prices[code]
+            if math.isnan(close_price):
+                close_price = pos_avg[code]
+            ok, sell_usdc, realized_pnl = _sell_update(
+                pos_size, pos_avg, code, float(close_price), float(pos_size[code])
             )
-            if result is not None:
-                capital = result["capital"]
+            if ok:
+                capital += sell_usdc + realized_pnl
                 trades.append({
                     "action": "SELL",
-                    "asset_id": asset_id,
-                    "price": close_price,
-                    "amount_usdc": result["sell_usdc"],
-                    "realized_pnl": result["realized_pnl"],
+                    "asset_id": arrays.assets[code],
+                    "price": round(float(close_price), 6),
+                    "amount_usdc": round(sell_usdc, 6),
+                    "realized_pnl": round(realized_pnl, 6),
                     "reason": "バックテスト終了: 強制クローズ",
                     "timestamp": "",
                 })
@@ -178,44 +612,149 @@ class BacktestEngine:
             "final_capital": capital,
             "initial_capital": self._initial_capital,
             "positions": {
-                aid: {
-                    "size_usdc": p.size_usdc,
-                    "average_price": p.average_price,
+                arrays.assets[code]: {
+                    "size_usdc": float(pos_size[code]),
+                    "average_price": float(pos_avg[code]),
                 }
-                for aid, p in positions.items()
-                if p.size_usdc > 0
+                for code in np.where(pos_size > 0)[0]
             },
         }
 
-    def _build_signal_data(
+    def run_vectorized(
         self,
-        tick: dict,
-        asset_id: str,
-        price: float,
-        positions: dict[str, _Position],
-        history_buffers: dict[str, deque],
+        ticks: TickArrays,
+        action_arr: np.ndarray,
+        amount_arr: np.ndarray,
     ) -> dict:
-        """calculate_signal に渡す data dict を構築
+        """事前計算済みシグナル配列でバックテスト実行（融合カーネル）
 
-        StrategyHandler._build_signal_data() と同一スキーマ。
+        calculate_signal を配列演算で事前計算できる戦略向け。
+        ティックループ全体を単一の @njit カーネルで回すため、
+        ティックごとのインタープリタコストがゼロになる。
+        状態を持つ戦略は run() のPythonパスを使うこと。
+
+        Args:
+            ticks: SoA形式のティックデータ
+            action_arr: ティックごとのアクション (int8: 0=HOLD, 1=BUY, 2=SELL)
+            amount_arr: ティックごとの注文額 USDC (float64)
+
+        Returns:
+            run() と同一スキーマの結果 dict
         """
-        pos = positions.get(asset_id)
-        position_usdc = pos.size_usdc if pos else 0.0
-        side = pos.side if pos else None
+        n = len(ticks)
+        if len(action_arr) != n or len(amount_arr) != n:
+            raise ValueError("action_arr / amount_arr の長さがティック数と一致しません")
+
+        n_assets = len(ticks.assets)
+        actions = np.ascontiguousarray(action_arr, dtype=np.int8)
+        exec_prices = _precompute_exec_prices(
+            actions,
+            ticks.price,
+            ticks.best_bid,
+            ticks.best_ask,
+            bool(self._use_book_price),
+            float(self._slippage_bps) / 10000.0,
+        )
+        (
+            capital,
+            pos_size,
+            pos_avg,
+            trade_count,
+            trade_tick,
+            trade_action,
+            trade_code,
+            trade_price,
+            trade_amount,
+            trade_pnl,
+            equity_arr,
+            capital_arr,
+        ) = _run_kernel(
+            ticks.price,
+            exec_prices,
+            ticks.asset_codes,
+            actions,
+            np.ascontiguousarray(amount_arr, dtype=np.float64),
+            n_assets,
+            float(self._initial_capital),
+        )
+
+        timestamps = ticks.timestamps
+        # 丸めはティックごとではなく、確定したトレード列へ一括適用
+        trade_price = np.round(trade_price[:trade_count], 6)
+        trade_amount = np.round(trade_amount[:trade_count], 6)
+        trade_pnl = np.round(trade_pnl[:trade_count], 6)
+        trades = []
+        for t in range(trade_count):
+            tick = trade_tick[t]
+            forced = tick < 0
+            trades.append({
+                "action": "BUY" if trade_action[t] == 1 else "SELL",
+                "asset_id": ticks.assets[trade_code[t]],
+                "price": float(trade_price[t]),
+                "amount_usdc": float(trade_amount[t]),
+                "realized_pnl": float(trade_pnl[t]),
+                "reason": "バックテスト終了: 強制クローズ" if forced else "",
+                "timestamp": "" if forced else timestamps[tick],
+            })
 
-        history = list(history_buffers.get(asset_id, []))
+        stride = self._equity_stride
+        if stride == 1:
+            indices = range(n)
+        else:
+            indices = list(range(0, n, stride))
+            if n > 0 and indices[-1] != n - 1:
+                indices.append(n - 1)
+        equity_curve = [
+            {
+                "timestamp": timestamps[i],
+                "equity": float(equity_arr[i]),
+                "capital": float(capital_arr[i]),
+            }
+            for i in indices
+        ]
 
         return {
-            "price": price,
-            "market_id": tick.get("market", ""),
-            "history": history,
-            "position_usdc": position_usdc,
-            "side": side,
-            "best_bid": tick.get("best_bid"),
-            "best_ask": tick.get("best_ask"),
-            "timestamp": tick.get("timestamp"),
+            "trades": trades,
+            "equity_curve": equity_curve,
+            "final_capital": float(capital),
+            "initial_capital": self._initial_capital,
+            "positions": {
+                ticks.assets[code]: {
+                    "size_usdc": float(pos_size[code]),
+                    "average_price": float(pos_avg[code]),
+                }
+                for code in np.where(pos_size > 0)[0]
+            },
         }
 
+    def _build_signal_data(
+        self,
+        buf: dict,
+        price: float,
+        market: str,
+        best_bid: float,
+        best_ask: float,
+        timestamp,
+        position_usdc: float,
+        side: Optional[str],
+        history: _HistoryView,
+    ) -> dict:
+        """calculate_signal に渡す data dict を構築
+
+        StrategyHandler._build_signal_data() と同一スキーマ。
+        history はリングバッファ上のゼロコピービュー（list互換の読み取り）。
+        新規 dict は生成せず buf を上書きして返す。
+        """
+        buf["price"] = price
+        buf["market_id"] = market
+        buf["history"] = history
+        buf["position_usdc"] = position_usdc
+        buf["side"] = side
+        buf["best_bid"] = None if math.isnan(best_bid) else best_bid
+        buf["best_ask"] = None if math.isnan(best_ask) else best_ask
+        buf["timestamp"] = timestamp
+        return buf
+
     def _calc_execution_price(
         self,
         action: str,
@@ -223,13 +762,16 @@ class BacktestEngine:
         best_bid: Any = None,
         best_ask: Any = None,
     ) -> float:
-        """約定価格を算出（OrderExecutor.calc_execution_price と同一ロジック）"""
+        """約定価格を算出（OrderExecutor.calc_execution_price と同一ロジック）
+
+        best_bid / best_ask は None と NaN のどちらも「欠損」として扱う。
+        """
         base = price
 
         if self._use_book_price:
-            if action == "BUY" and best_ask is not None:
+            if action == "BUY" and best_ask is not None and not math.isnan(best_ask):
                 base = float(best_ask)
-            elif action == "SELL" and best_bid is not None:
+            elif action == "SELL" and best_bid is not None and not math.isnan(best_bid):
                 base = float(best_bid)
 
         slip = self._slippage_bps / 10000
@@ -238,92 +780,4 @@ class BacktestEngine:
         else:
             exec_price = base * (1 - slip)
 
-        return round(exec_price, 6)
-
-    @staticmethod
-    def _process_buy(
-        asset_id: str,
-        market: str,
-        exec_price: float,
-        amount_usdc: float,
-        capital: float,
-        positions: dict[str, _Position],
-    ) -> Optional[dict]:
-        """BUY 処理（PositionManager.update_after_trade BUY と同一ロジック）"""
-        if amount_usdc > capital:
-            return None
-
-        pos = positions.get(asset_id)
-        if pos is None:
-            positions[asset_id] = _Position(
-                asset_id=asset_id,
-                market=market,
-                side="BUY",
-                size_usdc=amount_usdc,
-                average_price=exec_price,
-            )
-        else:
-            total_usdc = round(pos.size_usdc + amount_usdc, 6)
-            new_avg = round(
-                (pos.average_price * pos.size_usdc + exec_price * amount_usdc)
-                / total_usdc,
-                6,
-            )
-            pos.size_usdc = total_usdc
-            pos.average_price = new_avg
-
-        return {
-            "capital": capital - amount_usdc,
-            "amount_usdc": amount_usdc,
-        }
-
-    @staticmethod
-    def _process_sell(
-        asset_id: str,
-        exec_price: float,
-        amount_usdc: float,
-        capital: float,
-        positions: dict[str, _Position],
-    ) -> Optional[dict]:
-        """SELL 処理（PositionManager.update_after_trade SELL と同一ロジック）"""
-        pos = positions.get(asset_id)
-        if pos is None or pos.size_usdc <= 0:
-            return None
-
-        sell_usdc = round(min(amount_usdc, pos.size_usdc), 6)
-
-        realized_pnl = 0.0
-        if pos.average_price > 0:
-            realized_pnl = round(
-                sell_usdc * (exec_price - pos.average_price) / pos.average_price,
-                6,
-            )
-
-        remaining = round(pos.size_usdc - sell_usdc, 6)
-
-        if remaining <= 0.001:
-            pos.size_usdc = 0.0
-            pos.average_price = 0.0
-        else:
-            pos.size_usdc = remaining
-
-        return {
-            "capital": capital + sell_usdc + realized_pnl,
-            "sell_usdc": sell_usdc,
-            "realized_pnl": realized_pnl,
-        }
-
-    @staticmethod
-    def _calc_equity(
-        capital: float,
-        positions: dict[str, _Position],
-        last_prices: dict[str, float],
-    ) -> float:
-        """現在のエクイティ（資金 + 未実現含み益/損）を計算"""
-        equity = capital
-        for asset_id, pos in positions.items():
-            if pos.size_usdc <= 0 or pos.average_price <= 0:
-                continue
-            current_price = last_prices.get(asset_id, pos.average_price)
-            equity += pos.size_usdc * current_price / pos.average_price
-        return round(equity, 6)
+        return exec_price
@@ -3,14 +3,182 @@
 DataRecorder が出力した JSONL ファイルからティックデータをロードする。
 DB フォールバックも提供。
 """
-import json
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from glob import glob
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+import orjson
 from loguru import logger
 
+# 数値が文字列で記録されている場合に float 変換するフィールド
+_NUMERIC_FIELDS = ("price", "size", "best_bid", "best_ask")
+
+# .npz サイドカーキャッシュに保存するカラム
+# （バックテストが消費する正準フィールドのみ。その他のフィールドは
+#   キャッシュ経由のロードでは失われる）
+_STR_CACHE_FIELDS = ("asset_id", "market", "side", "timestamp")
+_NUM_CACHE_FIELDS = ("price", "size", "best_bid", "best_ask")
+
+
+def _npz_path(filepath: str) -> str:
+    """JSONL パスから .npz サイドカーのパスを得る"""
+    return str(Path(filepath).with_suffix(".npz"))
+
+
+def _save_npz_cache(filepath: str, ticks: list[dict]) -> None:
+    """パース結果を .npz サイドカーへ保存（失敗してもロードは続行）"""
+    columns: dict = {}
+    for field in _STR_CACHE_FIELDS:
+        columns[field] = np.asarray(
+            [str(t.get(field) or "") for t in ticks]
+        )
+    for field in _NUM_CACHE_FIELDS:
+        columns[field] = np.asarray(
+            [
+                float(t[field]) if t.get(field) is not None else np.nan
+                for t in ticks
+            ],
+            dtype=np.float64,
+        )
+    try:
+        np.savez(_npz_path(filepath), **columns)
+    except OSError as e:
+        logger.debug(f"npz キャッシュ保存失敗: {filepath} - {e}")
+
+
+def _load_npz_cache(
+    filepath: str,
+    market_id: Optional[str],
+    asset_id: Optional[str],
+) -> Optional[list[dict]]:
+    """.npz サイドカーが有効ならロードして dict リストへ復元
+
+    JSONL より古いキャッシュは無効。復元不能なら None を返し
+    JSON パース経路へフォールバックする。
+    """
+    cache_path = _npz_path(filepath)
+    try:
+        if os.path.getmtime(cache_path) < os.path.getmtime(filepath):
+            return None
+        data = np.load(cache_path, allow_pickle=False)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        str_cols = {f: data[f].tolist() for f in _STR_CACHE_FIELDS}
+        num_cols = {f: data[f].tolist() for f in _NUM_CACHE_FIELDS}
+    except KeyError:
+        return None  # 旧形式のキャッシュ
+
+    ticks = []
+    for i in range(len(str_cols["asset_id"])):
+        if market_id and str_cols["market"][i] != market_id:
+            continue
+        if asset_id and str_cols["asset_id"][i] != asset_id:
+            continue
+        tick = {f: str_cols[f][i] for f in _STR_CACHE_FIELDS}
+        tick["side"] = tick["side"] or None
+        for f in _NUM_CACHE_FIELDS:
+            value = num_cols[f][i]
+            tick[f] = None if value != value else value  # NaN -> None
+        ticks.append(tick)
+    return ticks
+
+
+def _parse_jsonl_file(
+    filepath: str,
+    market_id: Optional[str] = None,
+    asset_id: Optional[str] = None,
+    use_cache: bool = True,
+) -> list[dict]:
+    """単一 JSONL ファイルをパース
+
+    ProcessPoolExecutor でファイル単位に並列実行できるよう
+    モジュールトップレベル関数（pickle可能）にしている。
+    バイナリモードで読み、パース前にフィルタ値のバイト列部分一致で
+    行を棄却する（1アセット抽出時はほとんどの行が orjson.loads に
+    到達せずスキップされる）。
+
+    有効な .npz サイドカーがあれば JSON パースを完全にスキップする。
+    フルパース（フィルタなし）の後はサイドカーを書き出し、
+    再実行時のパースコストを償却する。
+    """
+    if use_cache:
+        cached = _load_npz_cache(filepath, market_id, asset_id)
+        if cached is not None:
+            return cached
+
+    ticks = []
+    market_bytes = market_id.encode() if market_id else None
+    asset_bytes = asset_id.encode() if asset_id else None
+    try:
+        with open(filepath, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return ticks  # 空ファイル
+
+            # mmap 上の改行オフセットを直接走査する。OS のページキャッシュが
+            # 並列ワーカー間で共有され、テキストデコードも発生しない。
+            with mm:
+                size = len(mm)
+                pos = 0
+                line_num = 0
+                while pos < size:
+                    nl = mm.find(b"\n", pos)
+                    if nl < 0:
+                        nl = size
+                    line = mm[pos:nl].strip()
+                    pos = nl + 1
+                    line_num += 1
+                    if not line:
+                        continue
+
+                    # パース前の粗いフィルタ（偽陽性はパース後に除外）
+                    if market_bytes and market_bytes not in line:
+                        continue
+                    if asset_bytes and asset_bytes not in line:
+                        continue
+
+                    try:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        logger.warning(
+                            f"不正な JSON 行をスキップ: {filepath}:{line_num}"
+                        )
+                        continue
+
+                    # フィルタ
+                    if market_id and record.get("market") != market_id:
+                        continue
+                    if asset_id and record.get("asset_id") != asset_id:
+                        continue
+
+                    # 数値フィールドを float 変換
+                    for field in _NUMERIC_FIELDS:
+                        value = record.get(field)
+                        if value is not None and type(value) is not float:
+                            try:
+                                record[field] = float(value)
+                            except (ValueError, TypeError):
+                                pass
+                    ticks.append(record)
+    except OSError as e:
+        logger.error(f"ファイル読み込みエラー: {filepath} - {e}")
+        return ticks
+
+    # フルパース時のみキャッシュを書く（フィルタ付きの結果は部分集合のため）
+    if use_cache and market_id is None and asset_id is None:
+        _save_npz_cache(filepath, ticks)
+
+    return ticks
+
 
 class DataFetcher:
     """JSONL / DB からバックテスト用ティックデータを取得"""
@@ -37,6 +205,25 @@ class DataFetcher:
         Returns:
             timestamp 昇順でソートされたティックデータのリスト
         """
+        ticks = self._load_unsorted(market_id, asset_id, start_date, end_date)
+
+        # timestamp 昇順ソート
+        # Python比較ではなく NumPy argsort（C実装・ISO-8601は辞書順=時系列順）
+        if ticks:
+            keys = np.asarray([t.get("timestamp", "") for t in ticks])
+            ticks = [ticks[i] for i in np.argsort(keys, kind="stable")]
+
+        logger.info(f"JSONL から {len(ticks)} 件のティックデータをロード")
+        return ticks
+
+    def _load_unsorted(
+        self,
+        market_id: Optional[str],
+        asset_id: Optional[str],
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ) -> list[dict]:
+        """JSONL からソートなしでロード（ソートは呼び出し側の責務）"""
         pattern = str(self.data_dir / "price_changes_*.jsonl")
         files = sorted(glob(pattern))
 
@@ -47,17 +234,45 @@ class DataFetcher:
         # 日付フィルタ用にファイルを絞り込み
         if start_date or end_date:
             files = self._filter_files_by_date(files, start_date, end_date)
+            if not files:
+                return []
 
-        ticks = []
-        for filepath in files:
-            ticks.extend(self._parse_jsonl(filepath, market_id, asset_id))
-
-        # timestamp 昇順ソート
-        ticks.sort(key=lambda t: t.get("timestamp", ""))
+        # JSON デコードは CPU バウンドなのでファイル単位でプロセス並列化
+        # （1ファイルならプロセス起動コストを避けてインライン実行）
+        if len(files) == 1:
+            ticks = _parse_jsonl_file(files[0], market_id, asset_id)
+        else:
+            parse = partial(
+                _parse_jsonl_file, market_id=market_id, asset_id=asset_id
+            )
+            workers = min(len(files), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                per_file = list(executor.map(parse, files))
+            ticks = []
+            for file_ticks in per_file:
+                ticks.extend(file_ticks)
 
-        logger.info(f"JSONL から {len(ticks)} 件のティックデータをロード")
         return ticks
 
+    def load_jsonl_soa(
+        self,
+        market_id: Optional[str] = None,
+        asset_id: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ):
+        """JSONL からロードし SoA（TickArrays）で返す
+
+        BacktestEngine.run に直接渡せる。引数は load_jsonl_files と同じ。
+        ソートは dict のリストではなく SoA カラム上の argsort で行う。
+        """
+        from backtester.backtest_engine import TickArrays
+
+        ticks = self._load_unsorted(market_id, asset_id, start_date, end_date)
+        arrays = TickArrays.from_ticks(ticks).sort_by_timestamp()
+        logger.info(f"JSONL から {len(arrays)} 件のティックデータをロード")
+        return arrays
+
     def load_from_db(self, market: str, minutes: int = 1440) -> list[dict]:
         """DB から価格履歴をロード（フォールバック）
 
@@ -119,50 +334,3 @@ class DataFetcher:
 
         return filtered
 
-    def _parse_jsonl(
-        self,
-        filepath: str,
-        market_id: Optional[str],
-        asset_id: Optional[str],
-    ) -> list[dict]:
-        """単一 JSONL ファイルをパース"""
-        ticks = []
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        record = json.loads(line)
-                    except json.JSONDecodeError:
-                        logger.warning(
-                            f"不正な JSON 行をスキップ: {filepath}:{line_num}"
-                        )
-                        continue
-
-                    # フィルタ
-                    if market_id and record.get("market") != market_id:
-                        continue
-                    if asset_id and record.get("asset_id") != asset_id:
-                        continue
-
-                    # 数値フィールドを float 変換
-                    record = self._convert_numeric_fields(record)
-                    ticks.append(record)
-        except OSError as e:
-            logger.error(f"ファイル読み込みエラー: {filepath} - {e}")
-
-        return ticks
-
-    @staticmethod
-    def _convert_numeric_fields(record: dict) -> dict:
-        """文字列の数値フィールドを float に変換"""
-        numeric_fields = ["price", "size", "best_bid", "best_ask"]
-        for field in numeric_fields:
-            if field in record and record[field] is not None:
-                try:
-                    record[field] = float(record[field])
-                except (ValueError, TypeError):
-                    pass
-        return record
@@ -0,0 +1,103 @@
+"""並列バックテストオーケストレーター
+
+アセット独立のポートフォリオバックテストやパラメータスイープは
+互いに依存しないため、ProcessPoolExecutor でプロセス並列に実行する
+（GILの制約によりスレッドでは高速化しない）。
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from loguru import logger
+
+
+def _run_job(job: dict) -> dict:
+    """ワーカープロセス側で単一バックテストを実行
+
+    ProcessPoolExecutor へ渡すためモジュールトップレベル関数にする。
+    """
+    from backtester.backtest_engine import BacktestEngine
+
+    engine = BacktestEngine(
+        calculate_signal=job["calculate_signal"],
+        initial_capital=job.get("initial_capital", 10000.0),
+        slippage_config=job.get("slippage_config"),
+    )
+    result = engine.run(job["ticks"])
+    result["label"] = job["label"]
+    return result
+
+
+class ParallelBacktestOrchestrator:
+    """複数バックテストのプロセス並列実行
+
+    注意: calculate_signal は pickle 可能（モジュールトップレベルの関数）
+    である必要がある。config/strategy.py の calculate_signal はそのまま使える。
+
+    Args:
+        max_workers: ワーカープロセス数（省略時は CPU コア数）
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._max_workers = max_workers or os.cpu_count() or 1
+
+    def run_many(
+        self,
+        configs: list[dict],
+        ticks_by_asset: dict[str, list],
+    ) -> dict:
+        """アセット × 設定の全組み合わせを並列実行
+
+        Args:
+            configs: エンジン設定のリスト。各 dict:
+                - calculate_signal: シグナル計算関数（必須・pickle可能）
+                - initial_capital: 初期資金（省略時 10000.0）
+                - slippage_config: スリッページ設定
+                - label: 結果キーの接頭辞（省略時は連番）
+            ticks_by_asset: asset_id -> ティックデータ
+                （list[dict] または TickArrays）
+
+        Returns:
+            {results: {"<label>/<asset_id>": run()結果},
+             total_initial_capital, total_final_capital}
+        """
+        jobs = []
+        for i, config in enumerate(configs):
+            label = config.get("label", f"config{i}")
+            for asset_id, ticks in ticks_by_asset.items():
+                jobs.append({
+                    "calculate_signal": config["calculate_signal"],
+                    "initial_capital": config.get("initial_capital", 10000.0),
+                    "slippage_config": config.get("slippage_config"),
+                    "ticks": ticks,
+                    "label": f"{label}/{asset_id}",
+                })
+
+        if not jobs:
+            return {
+                "results": {},
+                "total_initial_capital": 0.0,
+                "total_final_capital": 0.0,
+            }
+
+        logger.info(
+            f"並列バックテスト開始: {len(jobs)} ジョブ / "
+            f"{self._max_workers} ワーカー"
+        )
+
+        with ProcessPoolExecutor(max_workers=self._max_workers) as executor:
+            results = list(executor.map(_run_job, jobs))
+
+        combined: dict = {"results": {}}
+        total_initial = 0.0
+        total_final = 0.0
+        for result in results:
+            combined["results"][result.pop("label")] = result
+            total_initial += result["initial_capital"]
+            total_final += result["final_capital"]
+
+        combined["total_initial_capital"] = total_initial
+        combined["total_final_capital"] = total_final
+
+        logger.info(f"並列バックテスト完了: {len(results)} 件")
+        return combined
@@ -32,27 +32,25 @@ class PerformanceAnalyzer:
         total_pnl = final_capital - initial_capital
         total_return_pct = (total_pnl / initial_capital * 100) if initial_capital > 0 else 0.0
 
-        # 取引分析
-        sell_trades = [t for t in trades if t.get("action") == "SELL"]
-        total_trades = len(sell_trades)
-
-        winning_trades = [t for t in sell_trades if t.get("realized_pnl", 0) > 0]
-        losing_trades = [t for t in sell_trades if t.get("realized_pnl", 0) < 0]
+        # 取引分析（SELL の実現損益を1パスで集計）
+        pnls = np.fromiter(
+            (
+                t.get("realized_pnl", 0)
+                for t in trades
+                if t.get("action") == "SELL"
+            ),
+            dtype=np.float64,
+        )
+        total_trades = len(pnls)
 
-        win_count = len(winning_trades)
-        lose_count = len(losing_trades)
+        win_mask = pnls > 0
+        lose_mask = pnls < 0
+        win_count = int(win_mask.sum())
+        lose_count = int(lose_mask.sum())
         win_rate_pct = (win_count / total_trades * 100) if total_trades > 0 else 0.0
 
-        avg_win = (
-            sum(t["realized_pnl"] for t in winning_trades) / win_count
-            if win_count > 0
-            else 0.0
-        )
-        avg_loss = (
-            sum(t["realized_pnl"] for t in losing_trades) / lose_count
-            if lose_count > 0
-            else 0.0
-        )
+        avg_win = float(pnls[win_mask].mean()) if win_count > 0 else 0.0
+        avg_loss = float(pnls[lose_mask].mean()) if lose_count > 0 else 0.0
         payoff_ratio = abs(avg_win / avg_loss) if avg_loss != 0 else 0.0
 
         # シャープレシオ
@@ -83,23 +81,25 @@ class PerformanceAnalyzer:
         if len(equity_curve) < 2:
             return 0.0
 
-        equities = [e["equity"] for e in equity_curve]
-        returns = []
-        for i in range(1, len(equities)):
-            if equities[i - 1] > 0:
-                returns.append((equities[i] - equities[i - 1]) / equities[i - 1])
-
-        if not returns:
+        eq = np.fromiter(
+            (e["equity"] for e in equity_curve),
+            dtype=np.float64,
+            count=len(equity_curve),
+        )
+        prev = eq[:-1]
+        mask = prev > 0
+        if not mask.any():
             return 0.0
 
-        arr = np.array(returns)
+        # リターンを1パスのベクトル演算で計算（prev<=0 のサンプルは除外）
+        arr = (np.diff(eq) / np.where(mask, prev, 1.0))[mask]
         std = float(np.std(arr))
         if std == 0:
             return 0.0
 
         mean_return = float(np.mean(arr))
         # 年率換算（ティック単位 → 概算で日次 252 営業日）
-        annualize = math.sqrt(min(len(returns), 252))
+        annualize = math.sqrt(min(len(arr), 252))
         return mean_return / std * annualize
 
     @staticmethod
@@ -108,14 +108,22 @@ class PerformanceAnalyzer:
         if not equity_curve:
             return 0.0
 
-        equities = np.array([e["equity"] for e in equity_curve])
-        if len(equities) == 0:
-            return 0.0
+        equities = np.fromiter(
+            (e["equity"] for e in equity_curve),
+            dtype=np.float64,
+            count=len(equity_curve),
+        )
 
         running_max = np.maximum.accumulate(equities)
-        # ゼロ除算防止
-        safe_max = np.where(running_max > 0, running_max, 1.0)
-        drawdowns = (running_max - equities) / safe_max * 100
+
+        # out= でバッファを再利用（このパスはメモリ帯域ネック）。
+        # 分子は必ずサニタイズ前の running_max で計算する
+        drawdowns = np.subtract(running_max, equities, out=equities)
+        if running_max[0] <= 0:
+            # エクイティが非正から始まる異常系のみ除数側をセーフ除算
+            running_max = np.where(running_max > 0, running_max, 1.0)
+        np.divide(drawdowns, running_max, out=drawdowns)
+        drawdowns *= 100.0
 
         return float(np.max(drawdowns))
 
@@ -207,11 +215,36 @@ class PerformanceAnalyzer:
 
     @staticmethod
     def _plot_equity_curve(equity_curve: list[dict], filepath: Path) -> None:
-        """エクイティカーブを描画"""
-        equities = [e["equity"] for e in equity_curve]
+        """エクイティカーブを描画
+
+        100dpi では ~1200 x ピクセルしか解像できないため、長大な
+        カーブはバケットごとの min/max ペアにデシメーションしてから
+        描画する（視覚上の極値は保存される）。
+        """
+        equities = np.fromiter(
+            (e["equity"] for e in equity_curve),
+            dtype=np.float64,
+            count=len(equity_curve),
+        )
+
+        x = np.arange(len(equities), dtype=np.float64)
+        max_points = 10000
+        if len(equities) > max_points:
+            buckets = max_points // 2
+            size = len(equities) // buckets
+            trimmed = equities[: buckets * size].reshape(buckets, size)
+            lo = trimmed.argmin(axis=1)
+            hi = trimmed.argmax(axis=1)
+            offsets = np.arange(buckets) * size
+            # バケット内の min/max を時系列順に並べる
+            idx = np.sort(
+                np.concatenate((offsets + lo, offsets + hi))
+            )
+            x = x[idx]
+            equities = equities[idx]
 
         fig, ax = plt.subplots(figsize=(12, 6))
-        ax.plot(equities, linewidth=1.0, color="blue")
+        ax.plot(x, equities, linewidth=1.0, color="blue")
         ax.set_title("Equity Curve")
         ax.set_xlabel("Tick")
         ax.set_ylabel("Equity (USDC)")
@@ -228,7 +261,11 @@ class PerformanceAnalyzer:
         indices = list(range(len(pnls)))
 
         fig, ax = plt.subplots(figsize=(12, 6))
-        ax.scatter(indices, pnls, c=colors, alpha=0.6, s=20)
+        # 大量の点はベクタ描画せず PNG エンコーダに任せる
+        ax.scatter(
+            indices, pnls, c=colors, alpha=0.6, s=20,
+            rasterized=len(pnls) > 50000,
+        )
         ax.axhline(y=0, color="black", linewidth=0.5)
         ax.set_title("Trade P&L")
         ax.set_xlabel("Trade #")
@@ -1,41 +1,288 @@
 """データベース管理モジュール"""
+import threading
+import time
+from collections import deque
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from loguru import logger
-from sqlalchemy import create_engine, func, select
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import create_engine, delete, event, func, select, update
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from database.models import AlertLog, Base, NotificationHistory, Position, PriceHistory, Trade
 
+# コミットごとの fsync を避ける書き込み向けチューニング。
+# WAL + synchronous=NORMAL はクラッシュ時に直近トランザクションを
+# 失い得るが、DB破損はしない（価格ティックは再取得可能なデータ）。
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;"
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA mmap_size=268435456;"
+    "PRAGMA cache_size=-20000;"
+    "PRAGMA busy_timeout=5000;"
+)
+
+# 価格バッファをフラッシュする件数しきい値
+_PRICE_FLUSH_THRESHOLD = 500
+
+# WAL を切り詰めるチェックポイントの間隔（秒）。放置すると -wal が
+# 成長し続け、いずれ読み取り側がインラインでチェックポイント費用を払う
+_WAL_CHECKPOINT_INTERVAL = 60.0
+
+# 旧スキーマ（DateTime/Float列）からの移行定義。
+# (テーブル名, ((新列, 型宣言, 旧列, バックフィル式), ...), (インデックスSQL, ...))
+_US_FROM_DATETIME = "CAST((julianday({src}) - 2440587.5) * 86400000000 AS INTEGER)"
+_E6_FROM_FLOAT = "CAST(ROUND({src} * 1000000) AS INTEGER)"
+_LEGACY_MIGRATIONS = (
+    (
+        "price_history",
+        (("timestamp_us", "BIGINT", "timestamp", _US_FROM_DATETIME),),
+        ("CREATE INDEX IF NOT EXISTS ix_ph_market_ts"
+         " ON price_history (market, timestamp_us)",),
+    ),
+    (
+        "alert_log",
+        (("triggered_at_us", "BIGINT", "triggered_at", _US_FROM_DATETIME),),
+        ("CREATE INDEX IF NOT EXISTS ix_alert_name_ts"
+         " ON alert_log (alert_name, triggered_at_us)",),
+    ),
+    (
+        "trades",
+        (
+            ("price_e6", "BIGINT", "price", _E6_FROM_FLOAT),
+            ("amount_usdc_e6", "BIGINT", "amount_usdc", _E6_FROM_FLOAT),
+            ("realized_pnl_e6", "BIGINT", "realized_pnl", _E6_FROM_FLOAT),
+            ("created_at_us", "BIGINT", "created_at", _US_FROM_DATETIME),
+        ),
+        ("CREATE INDEX IF NOT EXISTS ix_trades_created"
+         " ON trades (created_at_us)",),
+    ),
+    (
+        "positions",
+        (
+            ("size_usdc_e6", "BIGINT DEFAULT 0", "size_usdc", _E6_FROM_FLOAT),
+            ("average_price_e6", "BIGINT DEFAULT 0", "average_price", _E6_FROM_FLOAT),
+            ("realized_pnl_e6", "BIGINT DEFAULT 0", "realized_pnl", _E6_FROM_FLOAT),
+        ),
+        (),
+    ),
+)
+
+def _to_us(dt: datetime) -> int:
+    """datetime を Unix マイクロ秒（DB格納形式）に変換"""
+    return int(dt.timestamp() * 1_000_000)
+
+
+def _from_us(us: int) -> datetime:
+    """Unix マイクロ秒を UTC datetime に変換"""
+    return datetime.fromtimestamp(us / 1_000_000, tz=timezone.utc)
+
+
+def _to_e6(value: float) -> int:
+    """USDC/価格をマイクロ単位（×1e6 の整数、DB格納形式）に変換"""
+    return int(round(value * 1_000_000))
+
+
+class PriceRow(NamedTuple):
+    """価格履歴の読み取り専用行
+
+    読み取り系はフォーマットして返すだけなので、ORMオブジェクト
+    （アイデンティティマップ登録 + expunge）を作らず軽量タプルで返す。
+    """
+    asset_id: str
+    market: Optional[str]
+    price: Optional[float]
+    size: Optional[float]
+    side: Optional[str]
+    best_bid: Optional[float]
+    best_ask: Optional[float]
+    timestamp: datetime
+
+
+@dataclass(slots=True, frozen=True)
+class PositionView:
+    """ポジションの読み取り専用ビュー
+
+    呼び出し側は属性参照のみなので、ORM の Position を具現化せず
+    不変structで返す。インプロセスのミラー辞書にもこの型で保持する。
+    """
+    asset_id: str
+    market: Optional[str]
+    side: str
+    size_usdc: float
+    average_price: float
+    realized_pnl: float
+    opened_at: datetime
+    updated_at: datetime
+
+
+class TradeRow(NamedTuple):
+    """取引記録の読み取り専用行"""
+    id: int
+    asset_id: str
+    market: Optional[str]
+    action: str
+    price: float
+    amount_usdc: float
+    simulated: int
+    realized_pnl: Optional[float]
+    reason: Optional[str]
+    created_at: datetime
+
 
 class DatabaseManager:
     """SQLiteデータベース管理クラス"""
 
     def __init__(self, db_path: str = "data/polybot.db"):
-        db_file = Path(db_path)
-        db_file.parent.mkdir(parents=True, exist_ok=True)
+        # 書き込みはイベントループ・alert-db/price-db エグゼキュータ・
+        # db-writer スレッドの複数スレッドから来るため、コネクションは
+        # スレッド間で共有しない（共有すると他スレッドの半端な
+        # トランザクションを巻き込んで COMMIT/ROLLBACK してしまう）。
+        if db_path == ":memory:":
+            # インメモリDBは接続ごとに別DBになるため1コネクション共有が
+            # 必須。代わりにトランザクションを _session でロック直列化する
+            self.engine = create_engine(
+                "sqlite://",
+                echo=False,
+                connect_args={"check_same_thread": False},
+                poolclass=StaticPool,
+            )
+            self._tx_lock: Optional[threading.RLock] = threading.RLock()
+        else:
+            # ファイルDBはプール既定のスレッドごと独立コネクション。
+            # 書き込みの直列化は WAL + busy_timeout に任せる
+            db_file = Path(db_path)
+            db_file.parent.mkdir(parents=True, exist_ok=True)
+            self.engine = create_engine(
+                f"sqlite:///{db_file}",
+                echo=False,
+                connect_args={"check_same_thread": False},
+            )
+            self._tx_lock = None
 
-        self.engine = create_engine(f"sqlite:///{db_file}", echo=False)
+        @event.listens_for(self.engine, "connect")
+        def _set_sqlite_pragmas(dbapi_conn, _record):
+            cursor = dbapi_conn.cursor()
+            cursor.executescript(_SQLITE_PRAGMAS)
+            cursor.close()
+
+        self._migrate_legacy_schema()
         Base.metadata.create_all(self.engine)
-        self._session_factory = sessionmaker(bind=self.engine)
+        # スレッドごとに長寿命セッションを再利用（毎呼び出しの生成/破棄を回避）
+        self._session_factory = scoped_session(
+            sessionmaker(bind=self.engine, expire_on_commit=False)
+        )
+
+        # 他プロセス（web API の uvicorn 等）が同じDBファイルに書き込む
+        # 構成のため、ミラー/カウンタは PRAGMA data_version で外部コミットを
+        # 検知して無効化する。data_version は「他コネクションによる変更」で
+        # 増えるので、専用コネクションで読み、自プロセスの書き込み後は
+        # _session が記録値を同期して自分の変更と区別する
+        self._dv_conn = self.engine.raw_connection()
+        self._dv_lock = threading.Lock()
+        self._data_version = self._query_data_version()
+
+        # 価格ティックの書き込みバッファ（行ごとトランザクションの回避）
+        self._price_buf: deque = deque()
+        self._price_buf_lock = threading.Lock()
+        self._price_seq = 0
+
+        # ポジションのインプロセスミラー。自プロセスの変更系メソッドは
+        # SQL成功後にライトスルーで同期し、他プロセスの変更は
+        # _check_external_change() による再ロードで追従する
+        self._positions_lock = threading.Lock()
+        self._positions: dict[str, PositionView] = self._load_positions()
+
+        # 本日実現P&Lと本日取引件数の累積カウンタ（SUM/COUNTスキャンの
+        # 回避。P&Lはマイクロ単位）。None はコールド状態を表し、次の
+        # get_daily_pnl / get_daily_trade_count でDBから再構築する
+        self._daily_pnl_e6: Optional[int] = None
+        self._daily_trades: Optional[int] = None
+        self._daily_pnl_date = datetime.now(timezone.utc).date()
+        self._daily_pnl_lock = threading.Lock()
+
+        # バッファの書き出しは専用ライタースレッドで行い、プロデューサ
+        # （websocket/アラートループ）を SQLite の fsync から切り離す。
+        # しきい値到達時は Event で即時に起こし、それ以外は定期ドレイン。
+        # 依存する状態が揃ってから最後に起動する
+        self._writer_wake = threading.Event()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, daemon=True, name="db-writer"
+        )
+        self._writer_thread.start()
 
         logger.info(f"データベース初期化完了: {db_path}")
 
+    def _migrate_legacy_schema(self) -> None:
+        """旧スキーマ（DateTime/Float列）のDBを現行スキーマへ移行する
+
+        Base.metadata.create_all() は既存テーブルに列を追加しないため、
+        永続化された data/polybot.db を旧バージョンから引き継ぐと
+        起動時に「no such column」で落ちる。旧列が残っているテーブルには
+        ここで新列の ALTER TABLE ADD + バックフィルを行い、旧列は
+        DROP COLUMN（SQLite >= 3.35、insert().returning と同じ前提）で
+        取り除いて NOT NULL 制約が新コードの INSERT を妨げないようにする。
+        新規DB・移行済みDBでは何もしない。
+        """
+        with self.engine.begin() as conn:
+            for table, columns, index_sqls in _LEGACY_MIGRATIONS:
+                info = conn.exec_driver_sql(
+                    f"PRAGMA table_info({table})"
+                ).fetchall()
+                if not info:
+                    continue  # テーブル未作成: create_all が現行スキーマで作る
+                existing = {row[1] for row in info}
+                migrated = False
+                for new_col, decl, legacy_col, expr in columns:
+                    if new_col in existing or legacy_col not in existing:
+                        continue
+                    conn.exec_driver_sql(
+                        f"ALTER TABLE {table} ADD COLUMN {new_col} {decl}"
+                    )
+                    conn.exec_driver_sql(
+                        f"UPDATE {table} SET {new_col} = "
+                        + expr.format(src=legacy_col)
+                    )
+                    conn.exec_driver_sql(
+                        f"ALTER TABLE {table} DROP COLUMN {legacy_col}"
+                    )
+                    migrated = True
+                if migrated:
+                    # 既存テーブルのインデックスも create_all は作らない
+                    for sql in index_sqls:
+                        conn.exec_driver_sql(sql)
+                    logger.info(f"旧スキーマを移行しました: {table}")
+
     @contextmanager
     def _session(self):
-        """セッション管理（commit/rollback）"""
+        """セッション管理（commit/rollback）
+
+        scoped_session が返すスレッドローカルなセッションを閉じずに
+        使い回す。close しないことで呼び出しごとのセッション構築を省く。
+        インメモリDB（コネクション共有）ではトランザクション全体を
+        ロックで直列化し、スレッド間の COMMIT/ROLLBACK 混線を防ぐ。
+        """
         session: Session = self._session_factory()
+        lock = self._tx_lock
+        if lock is not None:
+            lock.acquire()
         try:
             yield session
             session.commit()
+            # 自分の書き込みで data_version が進んだ分を記録値に同期し、
+            # 外部変更の誤検知（不要なミラー再ロード）を防ぐ
+            self._data_version = self._query_data_version()
         except Exception:
             session.rollback()
             raise
         finally:
-            session.close()
+            if lock is not None:
+                lock.release()
 
     def save_price(
         self,
@@ -48,40 +295,150 @@ class DatabaseManager:
         best_ask: Optional[float] = None,
         timestamp: Optional[datetime] = None,
     ) -> int:
-        """価格データをDBに保存"""
+        """価格データを書き込みバッファへ積む
+
+        行ごとの「1トランザクション=1行」を避けるため即時INSERTはせず、
+        バッファが一定件数に達するか、読み取り系メソッドが呼ばれた時点で
+        flush_prices() により1トランザクションで書き出す。
+
+        Returns:
+            合成シーケンス番号（DBの行IDではない）
+        """
+        row = {
+            "asset_id": asset_id,
+            "market": market,
+            "price": price,
+            "size": size,
+            "side": side,
+            "best_bid": best_bid,
+            "best_ask": best_ask,
+            # datetime オブジェクトの生成を避ける（ティックごとに呼ばれる）
+            "timestamp_us": (
+                _to_us(timestamp) if timestamp is not None
+                else time.time_ns() // 1_000
+            ),
+        }
+        with self._price_buf_lock:
+            self._price_buf.append(row)
+            self._price_seq += 1
+            seq = self._price_seq
+            should_flush = len(self._price_buf) >= _PRICE_FLUSH_THRESHOLD
+
+        if should_flush:
+            # 自スレッドで flush せずライタースレッドを起こす（非ブロッキング）
+            self._writer_wake.set()
+        return seq
+
+    def _writer_loop(self) -> None:
+        """ライタースレッド本体
+
+        しきい値到達の合図（Event）か一定間隔ごとにバッファをドレインし、
+        1トランザクションでまとめて書き出す。デーモンスレッドなので
+        プロセス終了時は自然に停止する（取りこぼしは flush_prices を
+        呼ぶ読み取り系と WAL により実害なし）。
+
+        あわせて定期的に PRAGMA wal_checkpoint(TRUNCATE) を発行し、
+        WAL ファイルの成長を抑える（読み取り側にチェックポイント費用を
+        払わせない）。
+        """
+        next_checkpoint = time.monotonic() + _WAL_CHECKPOINT_INTERVAL
+        while True:
+            self._writer_wake.wait(timeout=0.25)
+            self._writer_wake.clear()
+            try:
+                self.flush_prices()
+            except Exception as e:
+                logger.error(f"価格バッファの書き出しに失敗: {e}")
+
+            if time.monotonic() >= next_checkpoint:
+                next_checkpoint = time.monotonic() + _WAL_CHECKPOINT_INTERVAL
+                try:
+                    conn = self.engine.raw_connection()
+                    try:
+                        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                    finally:
+                        conn.close()
+                except Exception as e:
+                    # チェックポイントが取れなくてもループは維持する
+                    logger.debug(f"WAL チェックポイント失敗: {e}")
+
+    def flush_prices(self) -> int:
+        """バッファ済み価格ティックを1トランザクションで書き出す
+
+        Returns:
+            書き出した件数
+        """
+        with self._price_buf_lock:
+            if not self._price_buf:
+                return 0
+            rows = list(self._price_buf)
+            self._price_buf.clear()
+
         with self._session() as session:
-            record = PriceHistory(
-                asset_id=asset_id,
-                market=market,
-                price=price,
-                size=size,
-                side=side,
-                best_bid=best_bid,
-                best_ask=best_ask,
-                timestamp=timestamp or datetime.now(timezone.utc),
-            )
-            session.add(record)
-            session.flush()
-            return record.id
+            # ORMオブジェクトを作らず Core の executemany で一括INSERT
+            session.execute(PriceHistory.__table__.insert(), rows)
+        return len(rows)
+
+    def save_prices_bulk(self, rows: list[dict]) -> int:
+        """価格データをまとめて1トランザクションで保存
+
+        Args:
+            rows: save_priceと同じキーを持つdictのリスト
+
+        Returns:
+            保存した件数
+        """
+        if not rows:
+            return 0
+        now_us = time.time_ns() // 1_000
+        params = [
+            {
+                "asset_id": row["asset_id"],
+                "market": row.get("market"),
+                "price": row.get("price"),
+                "size": row.get("size"),
+                "side": row.get("side"),
+                "best_bid": row.get("best_bid"),
+                "best_ask": row.get("best_ask"),
+                "timestamp_us": (
+                    _to_us(ts) if (ts := row.get("timestamp")) is not None
+                    else now_us
+                ),
+            }
+            for row in rows
+        ]
+        with self._session() as session:
+            session.execute(PriceHistory.__table__.insert(), params)
+        return len(rows)
+
+    _PRICE_COLUMNS = (
+        PriceHistory.asset_id,
+        PriceHistory.market,
+        PriceHistory.price,
+        PriceHistory.size,
+        PriceHistory.side,
+        PriceHistory.best_bid,
+        PriceHistory.best_ask,
+        PriceHistory.timestamp_us,
+    )
 
     def get_price_history(
         self,
         market: str,
         minutes: int = 5,
-    ) -> list[PriceHistory]:
+    ) -> list[PriceRow]:
         """指定マーケットの直近N分間の価格履歴を取得"""
+        self.flush_prices()  # バッファ分も読めるように
         since = datetime.now(timezone.utc) - timedelta(minutes=minutes)
         with self._session() as session:
             stmt = (
-                select(PriceHistory)
+                select(*self._PRICE_COLUMNS)
                 .where(PriceHistory.market == market)
-                .where(PriceHistory.timestamp >= since)
-                .order_by(PriceHistory.timestamp.asc())
+                .where(PriceHistory.timestamp_us >= _to_us(since))
+                .order_by(PriceHistory.timestamp_us.asc())
             )
-            results = session.execute(stmt).scalars().all()
-            # detach from session
-            session.expunge_all()
-            return list(results)
+            rows = session.execute(stmt).all()
+        return [PriceRow(*row[:-1], _from_us(row[-1])) for row in rows]
 
     def save_alert_log(
         self,
@@ -94,18 +451,19 @@ class DatabaseManager:
     ) -> int:
         """アラートログをDBに保存"""
         with self._session() as session:
-            record = AlertLog(
-                alert_name=alert_name,
-                asset_id=asset_id,
-                condition_type=condition_type,
-                threshold=threshold,
-                current_value=current_value,
-                message=message,
-                triggered_at=datetime.now(timezone.utc),
+            # ORMの unit-of-work を介さず Core で直接 INSERT
+            result = session.execute(
+                AlertLog.__table__.insert().values(
+                    alert_name=alert_name,
+                    asset_id=asset_id,
+                    condition_type=condition_type,
+                    threshold=threshold,
+                    current_value=current_value,
+                    message=message,
+                    triggered_at_us=time.time_ns() // 1_000,
+                )
             )
-            session.add(record)
-            session.flush()
-            return record.id
+            return result.inserted_primary_key[0]
 
     def get_last_alert_time(
         self, alert_name: str, market: Optional[str] = None
@@ -113,13 +471,15 @@ class DatabaseManager:
         """指定アラートの最終発火時刻を取得"""
         with self._session() as session:
             stmt = (
-                select(AlertLog.triggered_at)
+                select(AlertLog.triggered_at_us)
                 .where(AlertLog.alert_name == alert_name)
-                .order_by(AlertLog.triggered_at.desc())
+                .order_by(AlertLog.triggered_at_us.desc())
                 .limit(1)
             )
             result = session.execute(stmt).scalar_one_or_none()
-            return result
+            if result is None:
+                return None
+            return datetime.fromtimestamp(result / 1_000_000, tz=timezone.utc)
 
     def save_notification_history(
         self,
@@ -130,16 +490,16 @@ class DatabaseManager:
     ) -> int:
         """通知履歴をDBに保存"""
         with self._session() as session:
-            record = NotificationHistory(
-                alert_log_id=alert_log_id,
-                channel=channel,
-                status=status,
-                error_message=error_message,
-                sent_at=datetime.now(timezone.utc),
+            result = session.execute(
+                NotificationHistory.__table__.insert().values(
+                    alert_log_id=alert_log_id,
+                    channel=channel,
+                    status=status,
+                    error_message=error_message,
+                    sent_at=datetime.now(timezone.utc),
+                )
             )
-            session.add(record)
-            session.flush()
-            return record.id
+            return result.inserted_primary_key[0]
 
     # --- Trade メソッド ---
 
@@ -155,57 +515,221 @@ class DatabaseManager:
         reason: Optional[str] = None,
     ) -> int:
         """取引記録をDBに保存"""
+        now = datetime.now(timezone.utc)
+        pnl_e6 = _to_e6(realized_pnl) if realized_pnl is not None else None
         with self._session() as session:
-            record = Trade(
-                asset_id=asset_id,
-                market=market,
-                action=action,
-                price=round(price, 6),
-                amount_usdc=round(amount_usdc, 6),
-                simulated=simulated,
-                realized_pnl=round(realized_pnl, 6) if realized_pnl is not None else None,
-                reason=reason,
-                created_at=datetime.now(timezone.utc),
+            result = session.execute(
+                Trade.__table__.insert().values(
+                    asset_id=asset_id,
+                    market=market,
+                    action=action,
+                    price_e6=_to_e6(price),
+                    amount_usdc_e6=_to_e6(amount_usdc),
+                    simulated=simulated,
+                    realized_pnl_e6=pnl_e6,
+                    reason=reason,
+                    created_at_us=_to_us(now),
+                )
             )
-            session.add(record)
-            session.flush()
-            return record.id
+            record_id = result.inserted_primary_key[0]
 
-    def get_trades_since(self, since: datetime) -> list[Trade]:
+        # 本日P&L・取引件数カウンタを加算（日付が変わっていたらリセット）。
+        # P&Lはマイクロ単位の整数加算なので丸め誤差が蓄積しない
+        with self._daily_pnl_lock:
+            if now.date() != self._daily_pnl_date:
+                self._daily_pnl_date = now.date()
+                self._daily_pnl_e6 = 0
+                self._daily_trades = 0
+            if self._daily_trades is not None:
+                self._daily_trades += 1
+            if pnl_e6 is not None and self._daily_pnl_e6 is not None:
+                self._daily_pnl_e6 += pnl_e6
+        return record_id
+
+    def get_trades_since(self, since: datetime) -> list[TradeRow]:
         """指定時刻以降の取引記録を取得"""
         with self._session() as session:
             stmt = (
-                select(Trade)
-                .where(Trade.created_at >= since)
-                .order_by(Trade.created_at.asc())
+                select(
+                    Trade.id,
+                    Trade.asset_id,
+                    Trade.market,
+                    Trade.action,
+                    Trade.price_e6,
+                    Trade.amount_usdc_e6,
+                    Trade.simulated,
+                    Trade.realized_pnl_e6,
+                    Trade.reason,
+                    Trade.created_at_us,
+                )
+                .where(Trade.created_at_us >= _to_us(since))
+                .order_by(Trade.created_at_us.asc())
+            )
+            rows = session.execute(stmt).all()
+        return [
+            TradeRow(
+                row.id,
+                row.asset_id,
+                row.market,
+                row.action,
+                row.price_e6 / 1_000_000,
+                row.amount_usdc_e6 / 1_000_000,
+                row.simulated,
+                (
+                    row.realized_pnl_e6 / 1_000_000
+                    if row.realized_pnl_e6 is not None else None
+                ),
+                row.reason,
+                _from_us(row.created_at_us),
             )
-            results = session.execute(stmt).scalars().all()
-            session.expunge_all()
-            return list(results)
+            for row in rows
+        ]
 
     def get_daily_pnl(self) -> float:
-        """本日のシミュレーション実現P&Lの合計を取得"""
-        today_start = datetime.now(timezone.utc).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
+        """本日のシミュレーション実現P&Lの合計を取得
+
+        save_trade が保守する累積カウンタを返す。コールドスタート時
+        （プロセス再起動後の初回）・日付ロールオーバー時・他プロセスの
+        コミット検知時のみ SUM() スキャンで再構築する（webプロセスは
+        自分では save_trade しないため、外部変更検知がないと初回の
+        SUM 値を当日いっぱい返し続けてしまう）。
+        """
+        self._check_external_change()
+        now = datetime.now(timezone.utc)
+        with self._daily_pnl_lock:
+            if now.date() != self._daily_pnl_date:
+                self._daily_pnl_date = now.date()
+                self._daily_pnl_e6 = None  # 再構築させる
+                self._daily_trades = None
+            if self._daily_pnl_e6 is not None:
+                return self._daily_pnl_e6 / 1_000_000
+
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        with self._session() as session:
+            stmt = (
+                select(func.coalesce(func.sum(Trade.realized_pnl_e6), 0))
+                .where(Trade.created_at_us >= _to_us(today_start))
+            )
+            total_e6 = int(session.execute(stmt).scalar())
+
+        with self._daily_pnl_lock:
+            self._daily_pnl_e6 = total_e6
+        return total_e6 / 1_000_000
+
+    def get_daily_trade_count(self) -> int:
+        """本日の取引件数を取得
+
+        get_daily_pnl と同じ累積カウンタ方式。注文チェックごとの
+        COUNT() スキャンをメモリ参照に置き換え、コールドスタート・
+        日付ロールオーバー・他プロセスのコミット検知時のみ
+        DBから再構築する。
+        """
+        self._check_external_change()
+        now = datetime.now(timezone.utc)
+        with self._daily_pnl_lock:
+            if now.date() != self._daily_pnl_date:
+                self._daily_pnl_date = now.date()
+                self._daily_pnl_e6 = None
+                self._daily_trades = None  # 再構築させる
+            if self._daily_trades is not None:
+                return self._daily_trades
+
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         with self._session() as session:
             stmt = (
-                select(func.coalesce(func.sum(Trade.realized_pnl), 0.0))
-                .where(Trade.created_at >= today_start)
+                select(func.count())
+                .select_from(Trade)
+                .where(Trade.created_at_us >= _to_us(today_start))
             )
-            result = session.execute(stmt).scalar()
-            return float(result)
+            count = int(session.execute(stmt).scalar())
+
+        with self._daily_pnl_lock:
+            self._daily_trades = count
+        return count
 
     # --- Position メソッド ---
 
-    def get_position(self, asset_id: str) -> Optional[Position]:
-        """asset_id のポジションを取得"""
+    _POSITION_COLUMNS = (
+        Position.asset_id,
+        Position.market,
+        Position.side,
+        Position.size_usdc_e6,
+        Position.average_price_e6,
+        Position.realized_pnl_e6,
+        Position.opened_at,
+        Position.updated_at,
+    )
+
+    def _load_positions(self) -> dict[str, PositionView]:
+        """起動時にポジション全件をミラー辞書へロード
+
+        SQLite の DateTime は naive で返るため、ソート比較できるよう
+        UTC の tz-aware に正規化して保持する（格納値は UTC）。
+        """
         with self._session() as session:
-            stmt = select(Position).where(Position.asset_id == asset_id)
-            result = session.execute(stmt).scalar_one_or_none()
-            if result:
-                session.expunge(result)
-            return result
+            rows = session.execute(select(*self._POSITION_COLUMNS)).all()
+
+        def _aware(dt: datetime) -> datetime:
+            return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt
+
+        return {
+            row.asset_id: PositionView(
+                row.asset_id,
+                row.market,
+                row.side,
+                row.size_usdc_e6 / 1_000_000,
+                row.average_price_e6 / 1_000_000,
+                row.realized_pnl_e6 / 1_000_000,
+                _aware(row.opened_at),
+                _aware(row.updated_at),
+            )
+            for row in rows
+        }
+
+    def _query_data_version(self) -> int:
+        """専用コネクションで PRAGMA data_version を読む"""
+        with self._dv_lock:
+            cursor = self._dv_conn.cursor()
+            try:
+                cursor.execute("PRAGMA data_version")
+                return cursor.fetchone()[0]
+            finally:
+                cursor.close()
+
+    def _check_external_change(self) -> None:
+        """他プロセスのコミットを検知したらミラー/カウンタを無効化する
+
+        web API プロセスの panic_close 等が同じDBファイルへ直接書き込む
+        ため、ミラー辞書を読む前に data_version を確認し、進んでいたら
+        ポジションを再ロード、日次カウンタはコールド状態へ戻す。
+        変更がなければ PRAGMA 1回（I/Oなし）で済む。
+        """
+        dv = self._query_data_version()
+        if dv == self._data_version:
+            return
+        self._data_version = dv
+        fresh = self._load_positions()
+        with self._positions_lock:
+            self._positions = fresh
+        with self._daily_pnl_lock:
+            self._daily_pnl_e6 = None
+            self._daily_trades = None
+
+    def get_position(self, asset_id: str) -> Optional[PositionView]:
+        """asset_id のポジションを取得（ミラー辞書から O(1)）"""
+        self._check_external_change()
+        with self._positions_lock:
+            return self._positions.get(asset_id)
+
+    def get_total_position_usdc(self) -> float:
+        """全ポジションの合計サイズ (USDC) を取得
+
+        外部変更がなければミラー辞書の走査のみで、SQLite には触れない。
+        """
+        self._check_external_change()
+        with self._positions_lock:
+            total = sum(p.size_usdc for p in self._positions.values())
+        return round(total, 6)
 
     def save_position(
         self,
@@ -215,21 +739,41 @@ class DatabaseManager:
         size_usdc: float,
         average_price: float,
     ) -> int:
-        """新規ポジションをDBに保存"""
+        """新規ポジションをDBに保存
+
+        INSERT ... RETURNING id（SQLite 3.35+）で挿入とID取得を1文で行う。
+        ORM の add + flush（INSERT + 行ID取得の2往復）は使わない。
+        """
+        now = datetime.now(timezone.utc)
+        size_e6 = _to_e6(size_usdc)
+        avg_e6 = _to_e6(average_price)
         with self._session() as session:
-            record = Position(
-                asset_id=asset_id,
-                market=market,
-                side=side,
-                size_usdc=round(size_usdc, 6),
-                average_price=round(average_price, 6),
-                realized_pnl=0.0,
-                opened_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc),
+            record_id = session.execute(
+                Position.__table__.insert()
+                .values(
+                    asset_id=asset_id,
+                    market=market,
+                    side=side,
+                    size_usdc_e6=size_e6,
+                    average_price_e6=avg_e6,
+                    realized_pnl_e6=0,
+                    opened_at=now,
+                    updated_at=now,
+                )
+                .returning(Position.id)
+            ).scalar_one()
+        with self._positions_lock:
+            self._positions[asset_id] = PositionView(
+                asset_id,
+                market,
+                side,
+                size_e6 / 1_000_000,
+                avg_e6 / 1_000_000,
+                0.0,
+                now,
+                now,
             )
-            session.add(record)
-            session.flush()
-            return record.id
+        return record_id
 
     def update_position(
         self,
@@ -238,51 +782,77 @@ class DatabaseManager:
         average_price: float,
         realized_pnl_delta: float = 0.0,
     ) -> None:
-        """ポジションを更新"""
-        with self._session() as session:
-            stmt = select(Position).where(Position.asset_id == asset_id)
-            position = session.execute(stmt).scalar_one_or_none()
-            if position:
-                position.size_usdc = round(size_usdc, 6)
-                position.average_price = round(average_price, 6)
-                position.realized_pnl = round(position.realized_pnl + realized_pnl_delta, 6)
-                position.updated_at = datetime.now(timezone.utc)
-
-    def get_all_positions(self) -> list[Position]:
-        """size_usdc > 0 のポジション全取得（Web API 用）"""
+        """ポジションを更新
+
+        SELECT してから ORM 属性を書き換える2文構成ではなく、
+        Core の UPDATE 1文で済ませる。realized_pnl の加算はマイクロ単位の
+        整数同士なのでSQL側でも誤差なく行える。
+        """
+        now = datetime.now(timezone.utc)
+        size_e6 = _to_e6(size_usdc)
+        avg_e6 = _to_e6(average_price)
+        delta_e6 = _to_e6(realized_pnl_delta)
         with self._session() as session:
             stmt = (
-                select(Position)
-                .where(Position.size_usdc > 0)
-                .order_by(Position.updated_at.desc())
+                update(Position)
+                .where(Position.asset_id == asset_id)
+                .values(
+                    size_usdc_e6=size_e6,
+                    average_price_e6=avg_e6,
+                    realized_pnl_e6=Position.realized_pnl_e6 + delta_e6,
+                    updated_at=now,
+                )
             )
-            results = session.execute(stmt).scalars().all()
-            session.expunge_all()
-            return list(results)
+            session.execute(stmt)
+        with self._positions_lock:
+            current = self._positions.get(asset_id)
+            if current is not None:
+                self._positions[asset_id] = PositionView(
+                    current.asset_id,
+                    current.market,
+                    current.side,
+                    size_e6 / 1_000_000,
+                    avg_e6 / 1_000_000,
+                    (_to_e6(current.realized_pnl) + delta_e6) / 1_000_000,
+                    current.opened_at,
+                    now,
+                )
+
+    def get_all_positions(self) -> list[PositionView]:
+        """size_usdc > 0 のポジション全取得（Web API 用）
+
+        外部変更がなければミラー辞書から返すため SQLite には触れない。
+        """
+        self._check_external_change()
+        with self._positions_lock:
+            positions = [
+                p for p in self._positions.values() if p.size_usdc > 0
+            ]
+        positions.sort(key=lambda p: p.updated_at, reverse=True)
+        return positions
 
     def get_price_history_range(
         self,
         market: str,
         since: datetime,
         until: datetime,
-    ) -> list[PriceHistory]:
+    ) -> list[PriceRow]:
         """期間指定の価格履歴取得（バックテスト用）"""
+        self.flush_prices()  # バッファ分も読めるように
         with self._session() as session:
             stmt = (
-                select(PriceHistory)
+                select(*self._PRICE_COLUMNS)
                 .where(PriceHistory.market == market)
-                .where(PriceHistory.timestamp >= since)
-                .where(PriceHistory.timestamp <= until)
-                .order_by(PriceHistory.timestamp.asc())
+                .where(PriceHistory.timestamp_us >= _to_us(since))
+                .where(PriceHistory.timestamp_us <= _to_us(until))
+                .order_by(PriceHistory.timestamp_us.asc())
             )
-            results = session.execute(stmt).scalars().all()
-            session.expunge_all()
-            return list(results)
+            rows = session.execute(stmt).all()
+        return [PriceRow(*row[:-1], _from_us(row[-1])) for row in rows]
 
     def delete_position(self, asset_id: str) -> None:
         """ポジションを削除"""
         with self._session() as session:
-            stmt = select(Position).where(Position.asset_id == asset_id)
-            position = session.execute(stmt).scalar_one_or_none()
-            if position:
-                session.delete(position)
+            session.execute(delete(Position).where(Position.asset_id == asset_id))
+        with self._positions_lock:
+            self._positions.pop(asset_id, None)
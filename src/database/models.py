@@ -1,10 +1,30 @@
 """データベースモデル定義（SQLAlchemy 2.x）"""
+import time
 from datetime import datetime, timezone
 
-from sqlalchemy import Float, Integer, String, Text, DateTime
+from sqlalchemy import BigInteger, Float, Index, Integer, String, Text, DateTime
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
+def _now_us() -> int:
+    """現在時刻を Unix マイクロ秒で返す（datetime を生成しない）"""
+    return time.time_ns() // 1_000
+
+
+def _us_to_datetime(us: int | None) -> datetime | None:
+    """Unix マイクロ秒を UTC datetime に変換"""
+    if us is None:
+        return None
+    return datetime.fromtimestamp(us / 1_000_000, tz=timezone.utc)
+
+
+def _e6_to_float(e6: int | None) -> float | None:
+    """マイクロ単位（×1e6 の整数）を USDC/価格の float に変換"""
+    if e6 is None:
+        return None
+    return e6 / 1_000_000
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -12,23 +32,33 @@ class Base(DeclarativeBase):
 class PriceHistory(Base):
     """価格履歴テーブル"""
     __tablename__ = "price_history"
+    # market=? AND timestamp>=? ... ORDER BY timestamp を
+    # ソートなしのインデックスシークで満たす複合インデックス
+    __table_args__ = (Index("ix_ph_market_ts", "market", "timestamp_us"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     asset_id: Mapped[str] = mapped_column(String(256), index=True)
-    market: Mapped[str | None] = mapped_column(String(256), nullable=True, index=True)
+    market: Mapped[str | None] = mapped_column(String(256), nullable=True)
     price: Mapped[float | None] = mapped_column(Float, nullable=True)
     size: Mapped[float | None] = mapped_column(Float, nullable=True)
     side: Mapped[str | None] = mapped_column(String(10), nullable=True)
     best_bid: Mapped[float | None] = mapped_column(Float, nullable=True)
     best_ask: Mapped[float | None] = mapped_column(Float, nullable=True)
-    timestamp: Mapped[datetime] = mapped_column(
-        DateTime, default=lambda: datetime.now(timezone.utc)
-    )
+    # DateTime 型の行ごとの Python 変換と文字列比較を避けるため
+    # Unix マイクロ秒の整数で保持。datetime が必要な読み手だけ
+    # timestamp プロパティで具現化する
+    timestamp_us: Mapped[int] = mapped_column(BigInteger, default=_now_us)
+
+    @property
+    def timestamp(self) -> datetime | None:
+        return _us_to_datetime(self.timestamp_us)
 
 
 class AlertLog(Base):
     """アラートログテーブル"""
     __tablename__ = "alert_log"
+    # get_last_alert_time（alert_name=? ORDER BY triggered_at DESC LIMIT 1）用
+    __table_args__ = (Index("ix_alert_name_ts", "alert_name", "triggered_at_us"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     alert_name: Mapped[str] = mapped_column(String(256))
@@ -37,9 +67,11 @@ class AlertLog(Base):
     threshold: Mapped[float] = mapped_column(Float)
     current_value: Mapped[float] = mapped_column(Float)
     message: Mapped[str] = mapped_column(Text)
-    triggered_at: Mapped[datetime] = mapped_column(
-        DateTime, default=lambda: datetime.now(timezone.utc)
-    )
+    triggered_at_us: Mapped[int] = mapped_column(BigInteger, default=_now_us)
+
+    @property
+    def triggered_at(self) -> datetime | None:
+        return _us_to_datetime(self.triggered_at_us)
 
 
 class NotificationHistory(Base):
@@ -59,19 +91,37 @@ class NotificationHistory(Base):
 class Trade(Base):
     """取引記録テーブル"""
     __tablename__ = "trades"
+    # get_trades_since / get_daily_pnl の created_at 範囲スキャン用
+    __table_args__ = (Index("ix_trades_created", "created_at_us"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     asset_id: Mapped[str] = mapped_column(String(256), index=True)
     market: Mapped[str | None] = mapped_column(String(256), nullable=True)
     action: Mapped[str] = mapped_column(String(10))  # BUY / SELL
-    price: Mapped[float] = mapped_column(Float)
-    amount_usdc: Mapped[float] = mapped_column(Float)
+    # 金額・価格は6桁固定小数なのでマイクロ単位（×1e6）の整数で保持。
+    # 丸め誤差がなく、SQLite の行サイズも double より小さい
+    price_e6: Mapped[int] = mapped_column(BigInteger)
+    amount_usdc_e6: Mapped[int] = mapped_column(BigInteger)
     simulated: Mapped[int] = mapped_column(Integer, default=1)
-    realized_pnl: Mapped[float | None] = mapped_column(Float, nullable=True)
+    realized_pnl_e6: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     reason: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=lambda: datetime.now(timezone.utc)
-    )
+    created_at_us: Mapped[int] = mapped_column(BigInteger, default=_now_us)
+
+    @property
+    def created_at(self) -> datetime | None:
+        return _us_to_datetime(self.created_at_us)
+
+    @property
+    def price(self) -> float:
+        return self.price_e6 / 1_000_000
+
+    @property
+    def amount_usdc(self) -> float:
+        return self.amount_usdc_e6 / 1_000_000
+
+    @property
+    def realized_pnl(self) -> float | None:
+        return _e6_to_float(self.realized_pnl_e6)
 
 
 class Position(Base):
@@ -87,9 +137,22 @@ class Position(Base):
     asset_id: Mapped[str] = mapped_column(String(256), unique=True, index=True)
     market: Mapped[str | None] = mapped_column(String(256), nullable=True)
     side: Mapped[str] = mapped_column(String(10), default="BUY")
-    size_usdc: Mapped[float] = mapped_column(Float, default=0.0)
-    average_price: Mapped[float] = mapped_column(Float, default=0.0)
-    realized_pnl: Mapped[float] = mapped_column(Float, default=0.0)
+    size_usdc_e6: Mapped[int] = mapped_column(BigInteger, default=0)
+    average_price_e6: Mapped[int] = mapped_column(BigInteger, default=0)
+    realized_pnl_e6: Mapped[int] = mapped_column(BigInteger, default=0)
+
+    @property
+    def size_usdc(self) -> float:
+        return self.size_usdc_e6 / 1_000_000
+
+    @property
+    def average_price(self) -> float:
+        return self.average_price_e6 / 1_000_000
+
+    @property
+    def realized_pnl(self) -> float:
+        return self.realized_pnl_e6 / 1_000_000
+
     opened_at: Mapped[datetime] = mapped_column(
         DateTime, default=lambda: datetime.now(timezone.utc)
     )
@@ -25,6 +25,11 @@ class OrderExecutor:
         cfg = slippage_config or {}
         self.use_book_price = cfg.get("use_book_price", True)
         self.slippage_bps = cfg.get("slippage_bps", 50)
+        # スリッページ係数は構築時に確定するので事前計算しておく
+        self._buy_mult = 1 + self.slippage_bps / 10000
+        self._sell_mult = 1 - self.slippage_bps / 10000
+        # ゼロスリップかつ板価格も使わない構成なら計算自体を省略できる
+        self._slippage_enabled = self.slippage_bps != 0 or self.use_book_price
 
         mode = "LIVE" if self.live_trading else "SIMULATED"
         logger.info(
@@ -44,20 +49,19 @@ class OrderExecutor:
         BUY: best_ask（なければ price）に正のスリッページを加算
         SELL: best_bid（なければ price）に負のスリッページを減算
         """
+        if not self._slippage_enabled:
+            return round(price, 6)
+
         base = price
+        is_buy = action == "BUY"
 
         if self.use_book_price:
-            if action == "BUY" and best_ask is not None:
+            if is_buy and best_ask is not None:
                 base = best_ask
-            elif action == "SELL" and best_bid is not None:
+            elif not is_buy and best_bid is not None:
                 base = best_bid
 
-        slip = self.slippage_bps / 10000
-        if action == "BUY":
-            exec_price = base * (1 + slip)
-        else:
-            exec_price = base * (1 - slip)
-
+        exec_price = base * (self._buy_mult if is_buy else self._sell_mult)
         return round(exec_price, 6)
 
     def execute(
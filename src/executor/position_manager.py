@@ -9,8 +9,7 @@ from typing import Optional
 
 from loguru import logger
 
-from database.db_manager import DatabaseManager
-from database.models import Position
+from database.db_manager import DatabaseManager, PositionView
 
 
 class PositionManager:
@@ -20,7 +19,7 @@ class PositionManager:
         self.db_manager = db_manager
         logger.info("PositionManager initialized")
 
-    def get_position(self, asset_id: str) -> Optional[Position]:
+    def get_position(self, asset_id: str) -> Optional[PositionView]:
         """asset_id のポジションを取得"""
         return self.db_manager.get_position(asset_id)
 
@@ -33,13 +32,7 @@ class PositionManager:
 
     def get_total_position_usdc(self) -> float:
         """全ポジションの合計サイズ (USDC) を取得"""
-        from sqlalchemy import select, func
-        from database.models import Position
-
-        with self.db_manager._session() as session:
-            stmt = select(func.coalesce(func.sum(Position.size_usdc), 0.0))
-            result = session.execute(stmt).scalar()
-            return round(float(result), 6)
+        return self.db_manager.get_total_position_usdc()
 
     def update_after_trade(
         self,
@@ -74,15 +67,12 @@ class PositionManager:
                     f"size={amount_usdc:.2f} USDC @ {price:.4f}"
                 )
             else:
-                # 加重平均で追加
-                total_usdc = round(position.size_usdc + amount_usdc, 6)
+                # 加重平均で追加（属性参照はローカルに束ねて1回ずつ）
+                pos_size = position.size_usdc
+                pos_avg = position.average_price
+                total_usdc = round(pos_size + amount_usdc, 6)
                 new_avg = round(
-                    (
-                        (position.average_price * position.size_usdc)
-                        + (price * amount_usdc)
-                    )
-                    / total_usdc,
-                    6,
+                    (pos_avg * pos_size + price * amount_usdc) / total_usdc, 6
                 )
                 self.db_manager.update_position(
                     asset_id=asset_id,
@@ -101,14 +91,13 @@ class PositionManager:
                 )
                 return 0.0
 
-            sell_usdc = round(min(amount_usdc, position.size_usdc), 6)
+            pos_size = position.size_usdc
+            pos_avg = position.average_price
+            sell_usdc = round(min(amount_usdc, pos_size), 6)
             # P&L = sell_amount * (sell_price - avg_price) / avg_price
-            if position.average_price > 0:
-                realized_pnl = round(
-                    sell_usdc * (price - position.average_price) / position.average_price,
-                    6,
-                )
-            remaining = round(position.size_usdc - sell_usdc, 6)
+            if pos_avg > 0:
+                realized_pnl = round(sell_usdc * (price - pos_avg) / pos_avg, 6)
+            remaining = round(pos_size - sell_usdc, 6)
 
             if remaining <= 0.001:
                 # 全決済
@@ -128,7 +117,7 @@ class PositionManager:
                 self.db_manager.update_position(
                     asset_id=asset_id,
                     size_usdc=remaining,
-                    average_price=position.average_price,
+                    average_price=pos_avg,
                     realized_pnl_delta=realized_pnl,
                 )
                 logger.info(
@@ -1,12 +1,15 @@
 """メインエントリーポイント"""
 import asyncio
-import json
 import sys
+import time
+from itertools import chain, islice
 from pathlib import Path
+from typing import Optional
 
 # srcディレクトリをパスに追加（Dockerとローカル両方対応）
 sys.path.insert(0, str(Path(__file__).parent))
 
+import orjson
 from loguru import logger
 
 from alerts.alert_engine import AlertEngine
@@ -25,6 +28,35 @@ from utils.config_loader import ConfigLoader
 from utils.logger import setup_logger
 
 
+# マーケット発見フェーズのスナップショットキャッシュ
+# （ウォームリスタート時に Gamma 取得とミッドポイント照会を丸ごと省く）
+_SUBSCRIPTION_CACHE_PATH = Path("data/.subscription_cache.json")
+_SUBSCRIPTION_CACHE_TTL = 300  # 秒
+
+
+def _load_subscription_cache() -> Optional[dict]:
+    """鮮度内の購読スナップショットを読み込む（なければ None）"""
+    try:
+        snapshot = orjson.loads(_SUBSCRIPTION_CACHE_PATH.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if time.time() - snapshot.get("fetched_at", 0) > _SUBSCRIPTION_CACHE_TTL:
+        return None
+    return snapshot
+
+
+def _save_subscription_cache(markets: list[dict], token_ids: list[str]):
+    """購読スナップショットを保存する（失敗しても起動は継続）"""
+    try:
+        _SUBSCRIPTION_CACHE_PATH.write_bytes(orjson.dumps({
+            "markets": markets,
+            "token_ids": token_ids,
+            "fetched_at": time.time(),
+        }))
+    except (OSError, TypeError) as e:
+        logger.warning(f"購読キャッシュ保存失敗: {e}")
+
+
 def extract_token_ids(market_info: dict) -> list[str]:
     """マーケット情報からCLOBトークンIDを抽出する"""
     clob_token_ids = market_info.get("clobTokenIds")
@@ -33,8 +65,8 @@ def extract_token_ids(market_info: dict) -> list[str]:
 
     if isinstance(clob_token_ids, str):
         try:
-            return json.loads(clob_token_ids)
-        except json.JSONDecodeError:
+            return orjson.loads(clob_token_ids)
+        except orjson.JSONDecodeError:
             return [clob_token_ids]
     elif isinstance(clob_token_ids, list):
         return clob_token_ids
@@ -53,10 +85,10 @@ def is_market_active(market_info: dict) -> bool:
     prices_raw = market_info.get("outcomePrices", "")
     if prices_raw:
         try:
-            prices = json.loads(prices_raw) if isinstance(prices_raw, str) else prices_raw
+            prices = orjson.loads(prices_raw) if isinstance(prices_raw, str) else prices_raw
             if all(float(p) in (0.0, 1.0) for p in prices):
                 return False
-        except (json.JSONDecodeError, ValueError):
+        except (orjson.JSONDecodeError, ValueError):
             pass
     return True
 
@@ -68,18 +100,20 @@ async def collect_markets_auto(poly_client: PolymarketClient, limit: int) -> lis
         active=True, closed=False, limit=limit * 3,  # 余裕を持って取得
     )
 
-    active_markets = []
-    for m in gamma_markets:
-        if not is_market_active(m):
-            continue
-        token_ids = extract_token_ids(m)
-        if not token_ids:
-            continue
-        active_markets.append(m)
-        if len(active_markets) >= limit:
-            break
+    def _active_with_tokens():
+        for m in gamma_markets:
+            if not is_market_active(m):
+                continue
+            token_ids = extract_token_ids(m)
+            if not token_ids:
+                continue
+            # 後段（ミッドポイント取得・購読）で clobTokenIds を
+            # 再パースしないよう、抽出済みのIDを添付しておく
+            m["_token_ids"] = token_ids
+            yield m
 
-    return active_markets
+    # limit 件そろったら残りのマーケットは評価しない
+    return list(islice(_active_with_tokens(), limit))
 
 
 async def collect_markets_manual(
@@ -89,14 +123,18 @@ async def collect_markets_manual(
     enabled = [m for m in markets_config if m.get("enabled", True)]
     logger.info(f"設定ファイルから {len(enabled)} 件のマーケットを読み込み")
 
+    # 1マーケット1リクエストのN+1を避け、condition_ids で一括取得
+    infos = await poly_client.get_markets_by_condition_ids(
+        [m["market_id"] for m in enabled]
+    )
+
     result = []
     for market in enabled:
-        condition_id = market["market_id"]
-        market_info = await poly_client.get_market_by_condition_id(condition_id)
+        market_info = infos.get(market["market_id"])
         if market_info and is_market_active(market_info):
             result.append(market_info)
         else:
-            name = market.get("name", condition_id)
+            name = market.get("name", market["market_id"])
             logger.warning(f"スキップ（見つからないか解決済み）: {name}")
     return result
 
@@ -110,6 +148,9 @@ async def main():
 
     ws_client = None
     poly_client = None
+    alert_handler = None
+    data_recorder = None
+    notification_manager = None
 
     try:
         # 設定読み込み
@@ -204,41 +245,70 @@ async def main():
             logger.warning(f"戦略ハンドラー初期化失敗（監視は継続）: {e}")
 
         # マーケット取得（自動 or 手動）
-        auto_discover = markets_config.get("auto_discover", False)
-        if auto_discover:
-            limit = markets_config.get("auto_discover_limit", 3)
-            target_markets = await collect_markets_auto(poly_client, limit)
-        else:
-            target_markets = await collect_markets_manual(
-                poly_client, markets_config.get("markets", [])
+        # 鮮度内のスナップショットがあれば Gamma への発見フェーズを省く
+        snapshot = _load_subscription_cache()
+        if snapshot is not None:
+            target_markets = snapshot["markets"]
+            logger.info(
+                f"購読キャッシュからウォームスタート: {len(target_markets)} マーケット"
             )
+        else:
+            auto_discover = markets_config.get("auto_discover", False)
+            if auto_discover:
+                limit = markets_config.get("auto_discover_limit", 3)
+                target_markets = await collect_markets_auto(poly_client, limit)
+            else:
+                target_markets = await collect_markets_manual(
+                    poly_client, markets_config.get("markets", [])
+                )
 
         if not target_markets:
             logger.error("監視対象のアクティブなマーケットが見つかりません。終了します。")
             return
 
-        # トークンID収集 & マーケット情報ログ出力
-        all_token_ids = []
-        for market_info in target_markets:
+        # トークンID収集（ログ出力とは分離した1パスのフラット化）
+        token_ids_by_market = [
+            market_info.get("_token_ids") or extract_token_ids(market_info)
+            for market_info in target_markets
+        ]
+        all_token_ids = list(chain.from_iterable(token_ids_by_market))
+
+        # マーケット情報ログ出力
+        for market_info, token_ids in zip(target_markets, token_ids_by_market):
             question = market_info.get("question", "N/A")
             outcomes = market_info.get("outcomes", "N/A")
             outcome_prices = market_info.get("outcomePrices", "N/A")
-            condition_id = market_info.get("conditionId", "N/A")
 
+            # f-string ではなく loguru の {} スタイルで遅延フォーマット
+            logger.info(
+                "監視対象: {q} | outcomes: {o} | prices: {p}",
+                q=question,
+                o=outcomes,
+                p=outcome_prices,
+            )
+            # 全IDの短縮リスト構築は避け、先頭のみプレビューする
             logger.info(
-                f"監視対象: {question} | "
-                f"outcomes: {outcomes} | "
-                f"prices: {outcome_prices}"
+                "  トークンID: {t}... 他{n}件",
+                t=token_ids[0][:16] if token_ids else "N/A",
+                n=max(0, len(token_ids) - 1),
             )
 
-            token_ids = extract_token_ids(market_info)
-            all_token_ids.extend(token_ids)
-            logger.info(f"  トークンID: {[tid[:16] + '...' for tid in token_ids]}")
+        if snapshot is None:
+            _save_subscription_cache(target_markets, all_token_ids)
 
             # REST APIで現在のミッドポイント価格を取得
-            for token_id in token_ids:
-                midpoint = await poly_client.get_midpoint(token_id)
-                if midpoint is not None:
+            # （逐次 await だと N×RTT かかるため全トークン分を一括で投げる。
+            # ウォームスタート時は WebSocket の book で即座に埋まるので省略）
+            midpoints = await asyncio.gather(
+                *(poly_client.get_midpoint(tid) for tid in all_token_ids),
+                return_exceptions=True,
+            )
+            for token_id, midpoint in zip(all_token_ids, midpoints):
+                if isinstance(midpoint, BaseException):
+                    logger.warning(
+                        f"  ミッドポイント取得失敗: {token_id[:16]}... - {midpoint}"
+                    )
+                elif midpoint is not None:
                     logger.info(f"  ミッドポイント: {token_id[:16]}... = {midpoint}")
 
         logger.info(f"合計 {len(target_markets)} マーケット / {len(all_token_ids)} トークンを監視")
@@ -269,6 +339,12 @@ async def main():
     finally:
         if ws_client:
             await ws_client.close()
+        if alert_handler:
+            await alert_handler.close()
+        if data_recorder:
+            await data_recorder.close()
+        if notification_manager:
+            await notification_manager.close()
         if poly_client:
             await poly_client.close()
         logger.info("=== PolyBot Framework 終了 ===")
@@ -9,54 +9,177 @@ data/ ディレクトリに保存する。Week 4のバックテスト用デー
   data/trades_YYYY-MM-DD.jsonl         - 取引イベント
 """
 import asyncio
-import json
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+import orjson
 from loguru import logger
 
+# 1回のドレインでまとめて書き出す最大イベント数
+_DRAIN_BATCH_SIZE = 256
+
+_PREFIX_BY_EVENT = {
+    "price_change": "price_changes",
+    "book": "books",
+    "last_trade_price": "trades",
+}
+
 
 class DataRecorder:
-    """JSONL形式でイベントデータをファイルに追記保存する"""
+    """JSONL形式でイベントデータをファイルに追記保存する
+
+    handle_event はキューへ積むだけで即座に返り、単一のバックグラウンド
+    タスクがキューを貪欲にドレインしてバッチ書き込みする。バースト時は
+    数十イベントが writelines 1回に合流する。
+
+    イベントごとに open/close せず、プレフィックスごとに追記モードの
+    ファイルハンドルを保持して書き続ける。日付が変わったらハンドルを
+    開き直してローテーションする。
+    """
 
     def __init__(self, data_dir: str = "data"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         self._file_handles: Dict[str, Any] = {}
+        # エポック日数での安価なローテーション判定（strftime は日付が
+        # 変わったときだけ実行する）
+        self._current_day_idx = -1
+        self._current_day = ""
+        self._lock = threading.Lock()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._writer_task: Optional[asyncio.Task] = None
         logger.info(f"DataRecorder 初期化完了: {self.data_dir}")
 
-    def _get_file_path(self, prefix: str) -> Path:
+    def _get_file_path(self, prefix: str, day: str) -> Path:
         """日付ベースのファイルパスを取得"""
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        return self.data_dir / f"{prefix}_{today}.jsonl"
+        return self.data_dir / f"{prefix}_{day}.jsonl"
+
+    def _get_handle(self, prefix: str, day_idx: int, now: datetime):
+        """プレフィックスの永続ハンドルを取得（日付変更時は開き直し）
+
+        ロック保持中に呼ぶこと。
+        """
+        if day_idx != self._current_day_idx:
+            # 日付ローテーション: 全ハンドルを閉じて作り直す
+            for fh in self._file_handles.values():
+                fh.close()
+            self._file_handles.clear()
+            self._current_day_idx = day_idx
+            self._current_day = now.strftime("%Y-%m-%d")
+
+        fh = self._file_handles.get(prefix)
+        if fh is None:
+            fh = open(
+                self._get_file_path(prefix, self._current_day),
+                "ab",
+                buffering=1 << 16,
+            )
+            self._file_handles[prefix] = fh
+        return fh
+
+    def _write_batch(self, items: list):
+        """(prefix, record) のバッチを書き出す（同期・別スレッドから呼ばれる）"""
+        now = datetime.now(timezone.utc)
+        day_idx = int(now.timestamp()) // 86400
+
+        bufs_by_prefix: Dict[str, list] = {}
+        for prefix, record in items:
+            # orjson は datetime をネイティブにISO文字列へ直列化し、
+            # bytes を直接返すので isoformat / encode が不要
+            record["recorded_at"] = now
+            bufs_by_prefix.setdefault(prefix, []).append(
+                orjson.dumps(record, option=orjson.OPT_UTC_Z)
+            )
 
-    def _write_file_sync(self, filepath: Path, record: Dict[str, Any]):
-        """JSONL形式で1行追記（同期・別スレッドから呼ばれる）"""
-        record["recorded_at"] = datetime.now(timezone.utc).isoformat()
-        with open(filepath, "a", encoding="utf-8") as f:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        with self._lock:
+            for prefix, bufs in bufs_by_prefix.items():
+                fh = self._get_handle(prefix, day_idx, now)
+                # 行ごとの + b"\n" 連結を避け、バッチ全体を1バッファに
+                # 結合して write 1回で書く
+                fh.write(b"\n".join(bufs) + b"\n")
+                fh.flush()
 
-    async def handle_event(self, event_type: str, data: Dict[str, Any]):
+    async def _drain(self):
+        """キューをドレインするバックグラウンドタスク"""
+        loop = asyncio.get_running_loop()
+        while True:
+            items = [await self._queue.get()]
+            # キューに溜まっている分を貪欲にまとめる
+            try:
+                while len(items) < _DRAIN_BATCH_SIZE:
+                    items.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                pass
+
+            try:
+                await loop.run_in_executor(None, self._write_batch, items)
+            except Exception as e:
+                logger.error(f"JSONL書き込みエラー: {e}")
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+
+    async def flush_async(self):
+        """キュー済みイベントの書き出し完了を待つ"""
+        await self._queue.join()
+        with self._lock:
+            for fh in self._file_handles.values():
+                fh.flush()
+
+    async def close(self):
+        """ライタータスクを止め、残りを書き出してハンドルを閉じる
+
+        cancel しただけではインフライトのバッチが書き込み途中で
+        捨てられるため、先にキューの消化を待ってからタスクを止め、
+        キャンセル完了まで await する。
+        """
+        task = self._writer_task
+        self._writer_task = None
+        if task is not None and not task.done():
+            # インフライトのバッチを書き切らせてから止める
+            # （_drain の finally が task_done を保証している）
+            await self._queue.join()
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        # タスク停止後に積まれたイベントがあれば同期で書き切る
+        remaining = []
+        try:
+            while True:
+                remaining.append(self._queue.get_nowait())
+        except asyncio.QueueEmpty:
+            pass
+        if remaining:
+            self._write_batch(remaining)
+
+        with self._lock:
+            for fh in self._file_handles.values():
+                fh.close()
+            self._file_handles.clear()
+            self._current_day_idx = -1
+            self._current_day = ""
+
+    def handle_event(self, event_type: str, data: Dict[str, Any]):
         """PriceMonitorから呼ばれるイベントハンドラー
 
         price_monitor.add_handler(recorder.handle_event) で登録する。
-        ファイル書き込みは run_in_executor で別スレッドに委譲し、
-        asyncio イベントループをブロックしない。
+        キューに積むだけなので await するものがなく、同期関数にして
+        イベントごとのコルーチン生成・スケジューリングを省いている
+        （イベントループ実行中のスレッドから呼ぶこと）。
 
         Args:
             event_type: イベント種別 ("price_change", "book", "last_trade_price")
             data: イベントデータ
         """
-        if event_type == "price_change":
-            prefix = "price_changes"
-        elif event_type == "book":
-            prefix = "books"
-        elif event_type == "last_trade_price":
-            prefix = "trades"
-        else:
+        prefix = _PREFIX_BY_EVENT.get(event_type)
+        if prefix is None:
             return
 
-        filepath = self._get_file_path(prefix)
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, self._write_file_sync, filepath, data)
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._drain())
+        self._queue.put_nowait((prefix, data))
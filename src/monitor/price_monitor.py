@@ -1,12 +1,39 @@
 """価格監視モジュール"""
 import asyncio
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Callable, Coroutine, Dict, List, Optional, Union
 
 from loguru import logger
 
-# ハンドラーの型: async def handler(event_type: str, data: dict) -> None
-EventHandler = Callable[[str, Dict[str, Any]], Coroutine[Any, Any, None]]
+
+@dataclass(slots=True)
+class PriceTick:
+    """アセットごとの最新価格状態
+
+    更新ごとに dict を割り当てる代わりの固定スキーマ struct
+    （slots なのでサイズが小さく構築も速い）。
+    """
+    price: Any
+    size: Any
+    side: Any
+    best_bid: Any
+    best_ask: Any
+    timestamp: Any
+
+
+@dataclass(slots=True)
+class OrderBook:
+    """アセットごとの最新オーダーブックスナップショット"""
+    bids: list
+    asks: list
+    timestamp: Any
+    market: Optional[str]
+
+# ハンドラーの型: (async) def handler(event_type: str, data: dict) -> None
+# I/O 待ちのない軽量ハンドラーは同期関数でもよい（コルーチン生成を省ける）
+EventHandler = Callable[[str, Dict[str, Any]], Union[Coroutine[Any, Any, None], None]]
 
 
 class PriceMonitor:
@@ -15,10 +42,36 @@ class PriceMonitor:
     Observerパターンにより外部ハンドラー（DB保存、アラート等）を登録可能。
     """
 
-    def __init__(self):
-        self.price_data: Dict[str, Dict[str, Any]] = {}
-        self.orderbooks: Dict[str, Dict[str, Any]] = {}
-        self._handlers: List[EventHandler] = []
+    def __init__(self, event_types: Optional[set] = None):
+        """初期化
+
+        Args:
+            event_types: 処理対象のイベント種別の集合（例: {"price_change"}）。
+                None の場合は全種別を処理する。指定すると対象外の
+                イベントはディスパッチ前に O(1) で棄却される。
+        """
+        self.price_data: Dict[str, PriceTick] = {}
+        self.orderbooks: Dict[str, OrderBook] = {}
+        # None = フィルタなし。frozenset なら membership 判定が最速
+        self._active_events: Optional[frozenset] = (
+            frozenset(event_types) if event_types else None
+        )
+        # (handler, is_async) のリスト
+        self._handlers: List[tuple] = []
+        # event_type → ハンドラーの辞書ディスパッチ。メッセージごとの
+        # if/elif の文字列比較チェーンを1回の辞書参照に置き換える
+        self._dispatch = {
+            "book": self._handle_book,
+            "price_change": self._handle_price_change,
+            "last_trade_price": self._handle_last_trade,
+            "tick_size_change": self._handle_tick_size_change,
+        }
+        # asset_id → 短縮表示のメモ化（トークン数は有限なので成長しない）
+        self._short_id_cache: Dict[str, str] = {}
+        # timestamp 欠落時のフォールバック文字列を1ms粒度でキャッシュ
+        # （isoformat はイベントあたり ~2µs と高頻度では無視できない）
+        self._last_ts_ns = 0
+        self._last_ts_str = ""
         logger.info("PriceMonitor 初期化完了")
 
     def add_handler(self, handler: EventHandler):
@@ -28,50 +81,81 @@ class PriceMonitor:
         イベント発生時に呼び出される。
 
         Args:
-            handler: async def handler(event_type: str, data: dict) -> None
+            handler: (async) def handler(event_type: str, data: dict) -> None
         """
-        self._handlers.append(handler)
+        # 同期/非同期の判定は登録時に1回だけ行う
+        self._handlers.append((handler, asyncio.iscoroutinefunction(handler)))
         logger.info(f"イベントハンドラー登録: {handler.__name__}")
 
     async def _notify_handlers(self, event_type: str, data: Dict[str, Any]):
-        """登録済みハンドラーにイベントを通知"""
-        for handler in self._handlers:
-            try:
-                await handler(event_type, data)
-            except Exception as e:
-                logger.error(f"ハンドラーエラー ({handler.__name__}): {e}")
+        """登録済みハンドラーにイベントを通知
+
+        同期ハンドラーはその場で実行し、非同期ハンドラーは gather で
+        並行ディスパッチする（I/O待ちのハンドラー同士が直列に
+        積み上がらないようにする）。
+        """
+        if not self._handlers:
+            return
+
+        coros = []
+        async_handlers = []
+        for handler, is_async in self._handlers:
+            if is_async:
+                coros.append(handler(event_type, data))
+                async_handlers.append(handler)
+            else:
+                try:
+                    handler(event_type, data)
+                except Exception as e:
+                    logger.error(f"ハンドラーエラー ({handler.__name__}): {e}")
+
+        if coros:
+            results = await asyncio.gather(*coros, return_exceptions=True)
+            for handler, result in zip(async_handlers, results):
+                if isinstance(result, BaseException):
+                    logger.error(
+                        f"ハンドラーエラー ({handler.__name__}): {result}"
+                    )
 
     async def on_price_update(self, data: Union[Dict, List, Any]):
-        """WebSocketメッセージ受信時のコールバック"""
+        """WebSocketメッセージ受信時のコールバック
+
+        WebSocketClient が list[dict] に正規化して渡してくるため、
+        フレームごとの型チェックは行わない（dict 単体も後方互換で
+        受け付ける）。不正な要素は _process_event 内の except で捌く。
+        """
         try:
-            if isinstance(data, list):
-                for item in data:
-                    if isinstance(item, dict):
-                        await self._process_event(item)
-            elif isinstance(data, dict):
-                await self._process_event(data)
+            if type(data) is not list:
+                data = (data,)
+            for item in data:
+                await self._process_event(item)
         except Exception as e:
             logger.error(f"価格更新処理エラー: {e} | data={str(data)[:200]}", exc_info=True)
 
     async def _process_event(self, data: Dict[str, Any]):
         """単一イベントを処理"""
         try:
-            event_type = data.get("event_type")
+            active = self._active_events
 
-            if event_type == "book":
-                await self._handle_book(data)
-            elif event_type == "last_trade_price":
-                await self._handle_last_trade(data)
-            elif event_type == "tick_size_change":
-                await self._handle_tick_size_change(data)
-            elif "price_changes" in data:
+            # バルクフレーム（price_changes 配列）はディスパッチ前に捌く
+            if "price_changes" in data:
+                if active is not None and "price_change" not in active:
+                    return
                 market = data.get("market", "")
                 for change in data["price_changes"]:
                     if isinstance(change, dict):
                         change["market"] = market
                         await self._handle_price_change(change)
-            elif event_type == "price_change":
-                await self._handle_price_change(data)
+                return
+
+            event_type = data.get("event_type")
+            # 対象外のイベント種別は辞書参照より前に棄却する
+            if active is not None and event_type not in active:
+                return
+
+            handler = self._dispatch.get(event_type)
+            if handler is not None:
+                await handler(data)
             else:
                 logger.debug(f"未処理イベント: keys={list(data.keys())}")
         except Exception as e:
@@ -80,10 +164,24 @@ class PriceMonitor:
                 exc_info=True,
             )
 
+    def _now_iso(self) -> str:
+        """現在時刻のISO文字列（1ms粒度キャッシュ付き）"""
+        ns = time.time_ns()
+        if ns - self._last_ts_ns > 1_000_000:
+            self._last_ts_str = datetime.fromtimestamp(
+                ns / 1e9, tz=timezone.utc
+            ).isoformat()
+            self._last_ts_ns = ns
+        return self._last_ts_str
+
     def _short_id(self, asset_id: Optional[str]) -> str:
         if not asset_id:
             return "unknown"
-        return asset_id[:16] + "..."
+        short = self._short_id_cache.get(asset_id)
+        if short is None:
+            short = asset_id[:16] + "..."
+            self._short_id_cache[asset_id] = short
+        return short
 
     async def _handle_book(self, data: Dict[str, Any]):
         """オーダーブックスナップショット処理"""
@@ -96,12 +194,7 @@ class PriceMonitor:
         bids = data.get("bids") or []
         asks = data.get("asks") or []
 
-        self.orderbooks[asset_id] = {
-            "bids": bids,
-            "asks": asks,
-            "timestamp": timestamp,
-            "market": market,
-        }
+        self.orderbooks[asset_id] = OrderBook(bids, asks, timestamp, market)
 
         best_bid = "N/A"
         best_ask = "N/A"
@@ -110,21 +203,28 @@ class PriceMonitor:
         if asks and isinstance(asks[0], dict):
             best_ask = asks[0].get("price", "N/A")
 
-        logger.info(
-            f"[BOOK] asset={self._short_id(asset_id)} | "
-            f"best_bid={best_bid} | best_ask={best_ask} | "
-            f"bids={len(bids)} | asks={len(asks)}"
+        # 高頻度イベントのログは DEBUG に落とし、文字列構築もレベルが
+        # 有効なときだけ行う（lazy=True）
+        logger.opt(lazy=True).debug(
+            "[BOOK] asset={} | best_bid={} | best_ask={} | bids={} | asks={}",
+            lambda: self._short_id(asset_id),
+            lambda: best_bid,
+            lambda: best_ask,
+            lambda: len(bids),
+            lambda: len(asks),
         )
 
-        await self._notify_handlers("book", {
-            "asset_id": asset_id,
-            "market": market,
-            "timestamp": timestamp,
-            "best_bid": best_bid,
-            "best_ask": best_ask,
-            "bids_count": len(bids),
-            "asks_count": len(asks),
-        })
+        # 購読者がいなければペイロード dict の構築ごと省く
+        if self._handlers:
+            await self._notify_handlers("book", {
+                "asset_id": asset_id,
+                "market": market,
+                "timestamp": timestamp,
+                "best_bid": best_bid,
+                "best_ask": best_ask,
+                "bids_count": len(bids),
+                "asks_count": len(asks),
+            })
 
     async def _handle_price_change(self, data: Dict[str, Any]):
         """価格変更イベント処理"""
@@ -138,33 +238,37 @@ class PriceMonitor:
         best_bid = data.get("best_bid")
         best_ask = data.get("best_ask")
         market = data.get("market")
-        timestamp = data.get("timestamp", datetime.now(timezone.utc).isoformat())
-
-        self.price_data[asset_id] = {
-            "price": price,
-            "size": size,
-            "side": side,
-            "best_bid": best_bid,
-            "best_ask": best_ask,
-            "timestamp": timestamp,
-        }
+        # デフォルト値を引数に書くと timestamp があっても毎回
+        # isoformat が走るため、欠落時のみ評価する
+        timestamp = data.get("timestamp")
+        if timestamp is None:
+            timestamp = self._now_iso()
 
-        logger.info(
-            f"[PRICE] asset={self._short_id(asset_id)} | "
-            f"side={side} | price={price} | size={size} | "
-            f"bid={best_bid} | ask={best_ask}"
+        self.price_data[asset_id] = PriceTick(
+            price, size, side, best_bid, best_ask, timestamp
         )
 
-        await self._notify_handlers("price_change", {
-            "asset_id": asset_id,
-            "market": market,
-            "price": price,
-            "size": size,
-            "side": side,
-            "best_bid": best_bid,
-            "best_ask": best_ask,
-            "timestamp": timestamp,
-        })
+        logger.opt(lazy=True).debug(
+            "[PRICE] asset={} | side={} | price={} | size={} | bid={} | ask={}",
+            lambda: self._short_id(asset_id),
+            lambda: side,
+            lambda: price,
+            lambda: size,
+            lambda: best_bid,
+            lambda: best_ask,
+        )
+
+        if self._handlers:
+            await self._notify_handlers("price_change", {
+                "asset_id": asset_id,
+                "market": market,
+                "price": price,
+                "size": size,
+                "side": side,
+                "best_bid": best_bid,
+                "best_ask": best_ask,
+                "timestamp": timestamp,
+            })
 
     async def _handle_last_trade(self, data: Dict[str, Any]):
         """最終取引価格イベント処理"""
@@ -173,17 +277,21 @@ class PriceMonitor:
         size = data.get("size")
         side = data.get("side")
 
-        logger.info(
-            f"[TRADE] asset={self._short_id(asset_id)} | "
-            f"side={side} | price={price} | size={size}"
+        logger.opt(lazy=True).debug(
+            "[TRADE] asset={} | side={} | price={} | size={}",
+            lambda: self._short_id(asset_id),
+            lambda: side,
+            lambda: price,
+            lambda: size,
         )
 
-        await self._notify_handlers("last_trade_price", {
-            "asset_id": asset_id,
-            "price": price,
-            "size": size,
-            "side": side,
-        })
+        if self._handlers:
+            await self._notify_handlers("last_trade_price", {
+                "asset_id": asset_id,
+                "price": price,
+                "size": size,
+                "side": side,
+            })
 
     async def _handle_tick_size_change(self, data: Dict[str, Any]):
         """ティックサイズ変更イベント処理"""
@@ -197,10 +305,11 @@ class PriceMonitor:
 
     def get_current_price(self, asset_id: str) -> Optional[float]:
         """現在価格を取得"""
-        if asset_id in self.price_data:
-            return float(self.price_data[asset_id]["price"])
+        tick = self.price_data.get(asset_id)
+        if tick is not None:
+            return float(tick.price)
         return None
 
-    def get_orderbook(self, asset_id: str) -> Optional[Dict[str, Any]]:
+    def get_orderbook(self, asset_id: str) -> Optional[OrderBook]:
         """現在のオーダーブックを取得"""
         return self.orderbooks.get(asset_id)
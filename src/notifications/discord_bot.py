@@ -1,21 +1,38 @@
 """Discord通知モジュール"""
 import os
+from typing import Optional
 
+import aiohttp
 from loguru import logger
 
 
 class DiscordNotifier:
-    """Discord Webhookを使用した通知クラス"""
+    """Discord Webhookを使用した通知クラス
+
+    discord_webhook SDK は同期 requests ベースでイベントループを
+    HTTP往復の間ブロックするため、aiohttp で直接 Webhook を叩く。
+    セッションは遅延初期化してコネクションを送信間で使い回す。
+    """
 
     def __init__(self):
         self.webhook_url = os.getenv("DISCORD_WEBHOOK_URL", "")
         self.enabled = bool(self.webhook_url)
+        self._session: Optional[aiohttp.ClientSession] = None
 
         if self.enabled:
             logger.info("Discord通知: 有効")
         else:
             logger.info("Discord通知: 無効（環境変数未設定）")
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """aiohttp セッションを取得（遅延初期化）"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10),
+                timeout=aiohttp.ClientTimeout(total=5),
+            )
+        return self._session
+
     async def send_message(
         self,
         market_name: str,
@@ -32,22 +49,25 @@ class DiscordNotifier:
             return False
 
         try:
-            from discord_webhook import DiscordWebhook
-
             content = (
                 f"**[{condition}]** {market_name}\n"
                 f"価格: {price}\n"
                 f"{message}"
             )
-            webhook = DiscordWebhook(url=self.webhook_url, content=content)
-            response = webhook.execute()
-            if response and response.status_code in (200, 204):
-                logger.info(f"Discord通知送信成功: {condition}")
-                return True
-            else:
-                status = response.status_code if response else "no response"
-                logger.error(f"Discord通知送信失敗: status={status}")
+            session = await self._get_session()
+            async with session.post(
+                self.webhook_url, json={"content": content}
+            ) as response:
+                if response.status in (200, 204):
+                    logger.info(f"Discord通知送信成功: {condition}")
+                    return True
+                logger.error(f"Discord通知送信失敗: status={response.status}")
                 return False
         except Exception as e:
             logger.error(f"Discord通知送信失敗: {e}")
             return False
+
+    async def close(self):
+        """HTTPセッションを閉じる"""
+        if self._session and not self._session.closed:
+            await self._session.close()
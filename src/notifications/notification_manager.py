@@ -1,4 +1,5 @@
 """通知管理モジュール"""
+import asyncio
 from typing import Optional
 
 from loguru import logger
@@ -41,6 +42,13 @@ class NotificationManager:
             active.append("Discord")
         logger.info(f"NotificationManager 初期化完了: チャンネル={active or 'なし'}")
 
+    async def close(self):
+        """各チャンネルのHTTPセッションを閉じる"""
+        if self.telegram:
+            await self.telegram.close()
+        if self.discord:
+            await self.discord.close()
+
     async def send_alert(
         self,
         alert_log_id: int,
@@ -60,25 +68,32 @@ class NotificationManager:
             logger.debug("有効な通知チャンネルがありません")
             return
 
-        for channel_name, notifier in notifiers:
-            try:
-                success = await notifier.send_message(
+        # チャンネルごとの送信を並行実行（所要時間が合計→最大になる）
+        results = await asyncio.gather(
+            *(
+                notifier.send_message(
                     market_name=market_name,
                     price=price,
                     condition=condition,
                     message=message,
                 )
-                status = "success" if success else "failed"
+                for _, notifier in notifiers
+            ),
+            return_exceptions=True,
+        )
+
+        for (channel_name, _), result in zip(notifiers, results):
+            if isinstance(result, BaseException):
+                logger.error(f"通知送信エラー ({channel_name}): {result}")
                 self.db.save_notification_history(
                     alert_log_id=alert_log_id,
                     channel=channel_name,
-                    status=status,
+                    status="error",
+                    error_message=str(result),
                 )
-            except Exception as e:
-                logger.error(f"通知送信エラー ({channel_name}): {e}")
+            else:
                 self.db.save_notification_history(
                     alert_log_id=alert_log_id,
                     channel=channel_name,
-                    status="error",
-                    error_message=str(e),
+                    status="success" if result else "failed",
                 )
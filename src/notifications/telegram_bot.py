@@ -1,22 +1,41 @@
 """Telegram通知モジュール"""
 import os
+from typing import Optional
 
+import aiohttp
 from loguru import logger
 
+TELEGRAM_API_HOST = "https://api.telegram.org"
+
 
 class TelegramNotifier:
-    """Telegram Bot APIを使用した通知クラス"""
+    """Telegram Bot APIを使用した通知クラス
+
+    メッセージごとに telegram.Bot を構築せず、aiohttp で
+    sendMessage エンドポイントを直接叩く。セッションは遅延初期化して
+    コネクションを送信間で使い回す。
+    """
 
     def __init__(self):
         self.bot_token = os.getenv("TELEGRAM_BOT_TOKEN", "")
         self.chat_id = os.getenv("TELEGRAM_CHAT_ID", "")
         self.enabled = bool(self.bot_token and self.chat_id)
+        self._session: Optional[aiohttp.ClientSession] = None
 
         if self.enabled:
             logger.info("Telegram通知: 有効")
         else:
             logger.info("Telegram通知: 無効（環境変数未設定）")
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """aiohttp セッションを取得（遅延初期化）"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10),
+                timeout=aiohttp.ClientTimeout(total=5),
+            )
+        return self._session
+
     async def send_message(
         self,
         market_name: str,
@@ -33,17 +52,26 @@ class TelegramNotifier:
             return False
 
         try:
-            from telegram import Bot
-
-            bot = Bot(token=self.bot_token)
             text = (
                 f"[{condition}] {market_name}\n"
                 f"価格: {price}\n"
                 f"{message}"
             )
-            await bot.send_message(chat_id=self.chat_id, text=text)
-            logger.info(f"Telegram通知送信成功: {condition}")
-            return True
+            session = await self._get_session()
+            async with session.post(
+                f"{TELEGRAM_API_HOST}/bot{self.bot_token}/sendMessage",
+                json={"chat_id": self.chat_id, "text": text},
+            ) as response:
+                if response.status == 200:
+                    logger.info(f"Telegram通知送信成功: {condition}")
+                    return True
+                logger.error(f"Telegram通知送信失敗: status={response.status}")
+                return False
         except Exception as e:
             logger.error(f"Telegram通知送信失敗: {e}")
             return False
+
+    async def close(self):
+        """HTTPセッションを閉じる"""
+        if self._session and not self._session.closed:
+            await self._session.close()
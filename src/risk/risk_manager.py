@@ -5,6 +5,35 @@ from loguru import logger
 
 from database.db_manager import DatabaseManager
 from executor.position_manager import PositionManager
+from utils._njit import njit
+
+
+@njit(cache=True)
+def _risk_gate(
+    amount_usdc: float,
+    max_single: float,
+    is_buy: bool,
+    total_pos: float,
+    max_total: float,
+    trade_count: int,
+    max_trades: int,
+    daily_pnl: float,
+    max_loss: float,
+) -> int:
+    """注文リスクの数値判定（0=許可, 1=単一サイズ, 2=ポジション上限,
+    3=日次回数, 4=日次損失）
+
+    numba 導入時はコンパイルされ、未導入時は純Pythonで同じ結果を返す。
+    """
+    if amount_usdc > max_single:
+        return 1
+    if is_buy and total_pos + amount_usdc > max_total:
+        return 2
+    if trade_count >= max_trades:
+        return 3
+    if daily_pnl < -max_loss:
+        return 4
+    return 0
 
 
 class RiskManager:
@@ -46,59 +75,72 @@ class RiskManager:
         Returns:
             True: 注文可能, False: 拒否
         """
+        # 現在時刻は注文チェック全体で1回だけ取得する
+        now = datetime.now(timezone.utc)
+
         # 1. サーキットブレーカー
-        if self._check_circuit_breaker():
+        if self._check_circuit_breaker(now):
             logger.warning(f"[RISK] サーキットブレーカー停止中: {asset_id[:16]}...")
             return False
 
-        # 2. 単一取引サイズ上限
-        if amount_usdc > self.max_single_trade_usdc:
+        # 2〜5. 数値判定は _risk_gate に集約（入力は全てメモリ上の
+        # カウンタ/ミラーで、DBラウンドトリップはない）
+        is_buy = action == "BUY"
+        total = (
+            self.position_manager.get_total_position_usdc() if is_buy else 0.0
+        )
+        trades_today = self.db_manager.get_daily_trade_count()
+        daily_pnl = self.db_manager.get_daily_pnl()
+
+        gate = _risk_gate(
+            amount_usdc,
+            float(self.max_single_trade_usdc),
+            is_buy,
+            total,
+            float(self.max_total_position_usdc),
+            trades_today,
+            int(self.max_daily_trades),
+            daily_pnl,
+            float(self.max_daily_loss_usdc),
+        )
+        if gate == 0:
+            return True
+
+        if gate == 1:
             logger.warning(
                 f"[RISK] 単一取引サイズ超過: {amount_usdc:.2f} > {self.max_single_trade_usdc}"
             )
-            return False
-
-        # 3. 最大ポジション上限（BUYのみ）
-        if action == "BUY":
-            total = self.position_manager.get_total_position_usdc()
-            if total + amount_usdc > self.max_total_position_usdc:
-                logger.warning(
-                    f"[RISK] ポジション上限超過: {total:.2f} + {amount_usdc:.2f} > "
-                    f"{self.max_total_position_usdc}"
-                )
-                return False
-
-        # 4. 日次取引回数上限
-        today_start = datetime.now(timezone.utc).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        trades_today = self.db_manager.get_trades_since(today_start)
-        if len(trades_today) >= self.max_daily_trades:
+        elif gate == 2:
             logger.warning(
-                f"[RISK] 日次取引上限: {len(trades_today)} >= {self.max_daily_trades}"
+                f"[RISK] ポジション上限超過: {total:.2f} + {amount_usdc:.2f} > "
+                f"{self.max_total_position_usdc}"
             )
-            return False
-
-        # 5. 日次損失上限（超過でサーキットブレーカー発動）
-        daily_pnl = self.db_manager.get_daily_pnl()
-        if daily_pnl < -self.max_daily_loss_usdc:
+        elif gate == 3:
+            logger.warning(
+                f"[RISK] 日次取引上限: {trades_today} >= {self.max_daily_trades}"
+            )
+        else:
             logger.warning(
                 f"[RISK] 日次損失上限超過: {daily_pnl:.2f} < -{self.max_daily_loss_usdc} → "
                 f"サーキットブレーカー発動"
             )
             self._trigger_circuit_breaker()
-            return False
+        return False
 
-        return True
+    def _check_circuit_breaker(self, now: datetime | None = None) -> bool:
+        """サーキットブレーカー状態を確認（クールダウン経過で自動復帰）
 
-    def _check_circuit_breaker(self) -> bool:
-        """サーキットブレーカー状態を確認（クールダウン経過で自動復帰）"""
+        Args:
+            now: 呼び出し元で取得済みの現在時刻（省略時は内部で取得）
+        """
         if not self._halted:
             return False
         if not self.cb_enabled:
             return False
 
-        elapsed = datetime.now(timezone.utc) - self._halted_at
+        if now is None:
+            now = datetime.now(timezone.utc)
+        elapsed = now - self._halted_at
         if elapsed >= timedelta(minutes=self.cb_cooldown_minutes):
             logger.info("[RISK] サーキットブレーカー解除（クールダウン経過）")
             self._halted = False
@@ -1,8 +1,14 @@
 """戦略ハンドラーモジュール"""
 import importlib.util
+import time
+from collections import deque
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional
 
+# 戦略に渡す価格履歴の保持窓（秒）と上限件数
+_HISTORY_WINDOW_SEC = 30 * 60
+_HISTORY_MAXLEN = 1800
+
 from loguru import logger
 
 from database.db_manager import DatabaseManager
@@ -12,9 +18,15 @@ from risk.risk_manager import RiskManager
 
 
 def _to_float(value) -> Optional[float]:
-    """値を float に安全変換（None/不正値は None を返す）"""
+    """値を float に安全変換（None/不正値は None を返す）
+
+    WebSocket 由来の値はほぼ None / float / str のいずれかなので、
+    よくある型は try/except を立てずに先に捌く。
+    """
     if value is None:
         return None
+    if type(value) is float:
+        return value
     try:
         return float(value)
     except (TypeError, ValueError):
@@ -41,6 +53,10 @@ class StrategyHandler:
         self.order_executor = order_executor
         self.position_manager = position_manager
         self._calculate_signal: Optional[Callable] = None
+        # market → (price, timestamp文字列, epoch秒) のリングバッファ。
+        # ティックごとの get_price_history スキャンを置き換え、DBは
+        # 初回シードのみに使う
+        self._history: Dict[str, deque] = {}
 
         self._load_strategy(strategy_path)
         logger.info(f"StrategyHandler initialized: strategy={strategy_path}")
@@ -86,6 +102,10 @@ class StrategyHandler:
         except (TypeError, ValueError):
             return
 
+        market = data.get("market", "")
+        if market:
+            self._record_tick(market, price, data.get("timestamp"))
+
         try:
             signal_data = self._build_signal_data(data, asset_id, price)
             signal = self._calculate_signal(signal_data)
@@ -153,19 +173,39 @@ class StrategyHandler:
         except Exception as e:
             logger.error(f"[STRATEGY] 戦略実行エラー: {e}", exc_info=True)
 
+    def _get_history_buffer(self, market: str) -> deque:
+        """マーケットのリングバッファを取得（初回はDBからシード）"""
+        buf = self._history.get(market)
+        if buf is None:
+            buf = deque(maxlen=_HISTORY_MAXLEN)
+            for r in self.db_manager.get_price_history(market, minutes=30):
+                if r.price is not None:
+                    buf.append(
+                        (float(r.price), str(r.timestamp), r.timestamp.timestamp())
+                    )
+            self._history[market] = buf
+        return buf
+
+    def _record_tick(self, market: str, price: float, timestamp) -> None:
+        """価格ティックをリングバッファに追記し、窓外を左端から捨てる"""
+        buf = self._get_history_buffer(market)
+        now = time.time()
+        buf.append((price, str(timestamp), now))
+        cutoff = now - _HISTORY_WINDOW_SEC
+        while buf and buf[0][2] < cutoff:
+            buf.popleft()
+
     def _build_signal_data(
         self, data: Dict[str, Any], asset_id: str, price: float
     ) -> Dict[str, Any]:
         """calculate_signal に渡す data dict を構築"""
-        # 価格履歴
+        # 価格履歴（DBスキャンではなくメモリ上のリングバッファから構築）
         market = data.get("market", "")
         history = []
         if market:
-            price_records = self.db_manager.get_price_history(market, minutes=30)
             history = [
-                {"price": float(r.price), "timestamp": str(r.timestamp)}
-                for r in price_records
-                if r.price is not None
+                {"price": p, "timestamp": t}
+                for p, t, _ in self._history.get(market, ())
             ]
 
         # ポジション情報
@@ -0,0 +1,22 @@
+"""numba オプショナルラッパー
+
+numba が導入されていれば本物の njit を、なければ関数をそのまま返す
+no-op デコレータを提供する。ホットパスの数値カーネルはこれを経由して
+デコレートし、numba なし環境でも純Pythonで同じ結果になるようにする。
+"""
+try:
+    from numba import njit  # noqa: F401
+
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - numba未導入環境のみ
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """numba.njit の no-op フォールバック"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def wrap(fn):
+            return fn
+
+        return wrap
@@ -12,25 +12,42 @@ class ConfigLoader:
 
     def __init__(self, config_dir: str = "config"):
         self.config_dir = Path(config_dir)
+        # (パス, mtime_ns) をキーにしたパース結果キャッシュ。
+        # 同一プロセス内の再読み込みを yaml.safe_load なしで返し、
+        # ファイルが更新されれば mtime が変わるので自然に無効化される
+        self._yaml_cache: Dict[tuple, Dict[str, Any]] = {}
         load_dotenv()
 
     def load_yaml(self, filename: str) -> Dict[str, Any]:
         """
-        YAMLファイルを読み込む
+        YAMLファイルを読み込む（mtimeキーのキャッシュ付き）
 
         Args:
             filename: ファイル名（例: "config.yaml"）
 
         Returns:
             Dict: 設定内容
+
+        Note:
+            同一ファイル・同一mtimeの再読み込みはキャッシュされた dict を
+            そのまま返す。呼び出し側で破壊的に変更しないこと。
         """
         filepath = self.config_dir / filename
 
-        if not filepath.exists():
+        try:
+            mtime_ns = os.stat(filepath).st_mtime_ns
+        except OSError:
             raise FileNotFoundError(f"設定ファイルが見つかりません: {filepath}")
 
+        cache_key = (str(filepath), mtime_ns)
+        cached = self._yaml_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         with open(filepath, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+            config = yaml.safe_load(f)
+        self._yaml_cache[cache_key] = config
+        return config
 
     def get_api_credentials(self) -> Dict[str, str]:
         """
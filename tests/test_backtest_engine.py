@@ -1,7 +1,8 @@
 """BacktestEngine テスト"""
+import numpy as np
 import pytest
 
-from backtester.backtest_engine import BacktestEngine
+from backtester.backtest_engine import BacktestEngine, TickArrays
 
 
 def _make_tick(
@@ -289,6 +290,20 @@ class TestEquityCurve:
 
         assert len(result["equity_curve"]) == 5
 
+    def test_equity_stride(self):
+        def hold_strategy(data):
+            return {"action": "HOLD", "amount": 0, "reason": "hold"}
+
+        engine = BacktestEngine(
+            hold_strategy, initial_capital=10000.0, equity_stride=3
+        )
+        ticks = [_make_tick(timestamp=f"2026-02-14T10:0{i}:00Z") for i in range(8)]
+        result = engine.run(ticks)
+
+        # tick 0, 3, 6 + 最終ティック 7
+        assert len(result["equity_curve"]) == 4
+        assert result["equity_curve"][-1]["timestamp"] == "2026-02-14T10:07:00Z"
+
     def test_equity_curve_has_timestamps(self):
         def hold_strategy(data):
             return {"action": "HOLD", "amount": 0, "reason": "hold"}
@@ -301,6 +316,97 @@ class TestEquityCurve:
         assert result["equity_curve"][0]["equity"] == 10000.0
 
 
+class TestHistoryView:
+    """リングバッファ履歴ビューの list 互換性"""
+
+    def test_history_contents(self):
+        seen = []
+
+        def strategy(data):
+            history = data["history"]
+            seen.append([h["price"] for h in history])
+            if len(history) >= 2:
+                assert history[-1]["price"] == data["price"]
+            return {"action": "HOLD", "amount": 0, "reason": "hold"}
+
+        engine = BacktestEngine(strategy, initial_capital=10000.0)
+        ticks = [
+            _make_tick(price=0.10 * (i + 1), timestamp=f"2026-02-14T10:0{i}:00Z")
+            for i in range(3)
+        ]
+        engine.run(ticks)
+
+        assert seen == [
+            [pytest.approx(0.10)],
+            [pytest.approx(0.10), pytest.approx(0.20)],
+            [pytest.approx(0.10), pytest.approx(0.20), pytest.approx(0.30)],
+        ]
+
+
+class TestRunVectorized:
+    """事前計算シグナル配列による融合カーネル実行"""
+
+    def test_matches_python_path(self):
+        """同じシグナル列で run() と同一の結果になる"""
+        call_count = [0]
+
+        def strategy(data):
+            call_count[0] += 1
+            if call_count[0] == 1:
+                return {"action": "BUY", "amount": 10.0, "reason": "buy"}
+            elif call_count[0] == 2:
+                return {"action": "SELL", "amount": 10.0, "reason": "sell"}
+            return {"action": "HOLD", "amount": 0, "reason": "hold"}
+
+        ticks = [
+            _make_tick(price=0.20, timestamp="2026-02-14T10:00:00Z"),
+            _make_tick(price=0.40, timestamp="2026-02-14T10:01:00Z"),
+            _make_tick(price=0.50, timestamp="2026-02-14T10:02:00Z"),
+        ]
+        config = {"use_book_price": False, "slippage_bps": 0}
+
+        engine = BacktestEngine(strategy, initial_capital=10000.0,
+                                slippage_config=config)
+        expected = engine.run(ticks)
+
+        arrays = TickArrays.from_ticks(ticks)
+        action_arr = np.array([1, 2, 0], dtype=np.int8)
+        amount_arr = np.array([10.0, 10.0, 0.0])
+        result = engine.run_vectorized(arrays, action_arr, amount_arr)
+
+        assert result["final_capital"] == pytest.approx(
+            expected["final_capital"], abs=0.01
+        )
+        assert len(result["trades"]) == len(expected["trades"])
+        assert len(result["equity_curve"]) == 3
+        assert [t["price"] for t in result["trades"]] == [
+            t["price"] for t in expected["trades"]
+        ]
+
+    def test_forced_close_in_kernel(self):
+        """未決済ポジションはカーネル内で強制クローズされる"""
+        engine = BacktestEngine(
+            lambda data: {"action": "HOLD", "amount": 0, "reason": ""},
+            initial_capital=10000.0,
+            slippage_config={"use_book_price": False, "slippage_bps": 0},
+        )
+        ticks = [
+            _make_tick(price=0.50, timestamp="2026-02-14T10:00:00Z"),
+            _make_tick(price=0.60, timestamp="2026-02-14T10:01:00Z"),
+        ]
+        arrays = TickArrays.from_ticks(ticks)
+        result = engine.run_vectorized(
+            arrays,
+            np.array([1, 0], dtype=np.int8),
+            np.array([10.0, 0.0]),
+        )
+
+        sell_trades = [t for t in result["trades"] if t["action"] == "SELL"]
+        assert len(sell_trades) == 1
+        assert "強制クローズ" in sell_trades[0]["reason"]
+        assert len(result["positions"]) == 0
+
+
 class TestSignalError:
     """シグナル計算エラー時にクラッシュしない"""
 
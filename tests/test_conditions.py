@@ -83,6 +83,26 @@ class TestConditionChecker:
         )
         assert result is True  # -20% <= -10%
 
+    def test_price_change_percent_from_ring_buffer(self, checker):
+        """record()で供給した履歴からDBなしで評価できること"""
+        old_time = datetime.now(timezone.utc) - timedelta(minutes=3)
+        checker.record("0xtest", 0.50, old_time)
+        result = checker.check_price_change_percent(
+            market="0xtest", current_price=0.60,
+            timeframe_minutes=5, threshold_percent=10.0,
+        )
+        assert result is True  # 20% > 10%
+
+    def test_ring_buffer_drops_stale_entries(self, checker):
+        """タイムフレーム外の履歴は評価対象から外れること"""
+        stale_time = datetime.now(timezone.utc) - timedelta(minutes=30)
+        checker.record("0xtest", 0.10, stale_time)
+        result = checker.check_price_change_percent(
+            market="0xtest", current_price=0.60,
+            timeframe_minutes=5, threshold_percent=10.0,
+        )
+        assert result is False  # 期間内履歴なし
+
     def test_price_change_percent_not_enough(self, db_manager, checker):
         """価格変動が閾値に達しない場合Falseを返す"""
         old_time = datetime.now(timezone.utc) - timedelta(minutes=3)
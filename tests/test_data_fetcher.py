@@ -163,6 +163,50 @@ class TestInvalidData:
         assert len(result) == 2
 
 
+class TestNpzCache:
+    """.npz サイドカーキャッシュ"""
+
+    def test_cache_written_and_reused(self, tmp_path):
+        ticks = [_make_tick(timestamp=f"2026-02-14T10:0{i}:00Z") for i in range(3)]
+        jsonl_path = tmp_path / "price_changes_2026-02-14.jsonl"
+        _write_jsonl(jsonl_path, ticks)
+
+        fetcher = DataFetcher(data_dir=str(tmp_path))
+        first = fetcher.load_jsonl_files()
+
+        # フルパース後に .npz サイドカーが生成される
+        npz_path = tmp_path / "price_changes_2026-02-14.npz"
+        assert npz_path.exists()
+
+        # キャッシュ経由のロードでも同じ結果
+        second = fetcher.load_jsonl_files()
+        assert len(second) == len(first) == 3
+        assert second[0]["price"] == 0.50
+        assert second[0]["best_bid"] == 0.49
+        assert second[0]["timestamp"] == "2026-02-14T10:00:00Z"
+
+        # キャッシュにもフィルタが効く
+        filtered = fetcher.load_jsonl_files(asset_id="no-such-asset")
+        assert filtered == []
+
+    def test_stale_cache_invalidated(self, tmp_path):
+        jsonl_path = tmp_path / "price_changes_2026-02-14.jsonl"
+        _write_jsonl(jsonl_path, [_make_tick(timestamp="2026-02-14T10:00:00Z")])
+
+        fetcher = DataFetcher(data_dir=str(tmp_path))
+        assert len(fetcher.load_jsonl_files()) == 1
+
+        # JSONL を更新 → キャッシュより新しくする
+        _write_jsonl(jsonl_path, [
+            _make_tick(timestamp="2026-02-14T10:00:00Z"),
+            _make_tick(timestamp="2026-02-14T10:01:00Z"),
+        ])
+        npz_path = tmp_path / "price_changes_2026-02-14.npz"
+        os.utime(npz_path, (0, 0))
+
+        assert len(fetcher.load_jsonl_files()) == 2
+
+
 class TestDbFallback:
     """DB フォールバック"""
 
@@ -9,8 +9,11 @@ from monitor.data_recorder import DataRecorder
 
 class TestDataRecorder:
     @pytest.fixture
-    def recorder(self, tmp_path):
-        return DataRecorder(data_dir=str(tmp_path))
+    async def recorder(self, tmp_path):
+        rec = DataRecorder(data_dir=str(tmp_path))
+        yield rec
+        # ライタータスクを残すとループ破棄時に未処理例外警告が出る
+        await rec.close()
 
     @pytest.mark.asyncio
     async def test_price_change_saved(self, recorder, tmp_path):
@@ -26,7 +29,8 @@ class TestDataRecorder:
             "timestamp": "2026-02-14T00:00:00Z",
         }
 
-        await recorder.handle_event("price_change", data)
+        recorder.handle_event("price_change", data)
+        await recorder.flush_async()
 
         files = list(tmp_path.glob("price_changes_*.jsonl"))
         assert len(files) == 1
@@ -52,7 +56,8 @@ class TestDataRecorder:
             "asks_count": 15,
         }
 
-        await recorder.handle_event("book", data)
+        recorder.handle_event("book", data)
+        await recorder.flush_async()
 
         files = list(tmp_path.glob("books_*.jsonl"))
         assert len(files) == 1
@@ -67,7 +72,8 @@ class TestDataRecorder:
             "side": "SELL",
         }
 
-        await recorder.handle_event("last_trade_price", data)
+        recorder.handle_event("last_trade_price", data)
+        await recorder.flush_async()
 
         files = list(tmp_path.glob("trades_*.jsonl"))
         assert len(files) == 1
@@ -76,10 +82,11 @@ class TestDataRecorder:
     async def test_multiple_records_appended(self, recorder, tmp_path):
         """複数レコードが同一ファイルに追記されること"""
         for i in range(3):
-            await recorder.handle_event("price_change", {
+            recorder.handle_event("price_change", {
                 "asset_id": f"token_{i}",
                 "price": str(0.5 + i * 0.1),
             })
+        await recorder.flush_async()
 
         files = list(tmp_path.glob("price_changes_*.jsonl"))
         assert len(files) == 1
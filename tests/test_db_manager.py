@@ -120,3 +120,160 @@ class TestDatabaseManager:
             error_message="Connection timeout",
         )
         assert notif_id > 0
+
+
+class TestLegacySchemaMigration:
+    """旧スキーマ（DateTime/Float列）DBからの起動時移行テスト"""
+
+    @pytest.fixture
+    def legacy_db_path(self, tmp_path):
+        """旧バージョンのテーブル定義でデータ入りのDBファイルを作る"""
+        import sqlite3
+
+        path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            """
+            CREATE TABLE positions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                asset_id VARCHAR(256) UNIQUE,
+                market VARCHAR(256),
+                side VARCHAR(10) NOT NULL,
+                size_usdc FLOAT NOT NULL,
+                average_price FLOAT NOT NULL,
+                realized_pnl FLOAT NOT NULL,
+                opened_at DATETIME NOT NULL,
+                updated_at DATETIME NOT NULL
+            );
+            CREATE TABLE trades (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                asset_id VARCHAR(256) NOT NULL,
+                market VARCHAR(256),
+                action VARCHAR(10) NOT NULL,
+                price FLOAT NOT NULL,
+                amount_usdc FLOAT NOT NULL,
+                simulated INTEGER NOT NULL,
+                realized_pnl FLOAT,
+                reason TEXT,
+                created_at DATETIME NOT NULL
+            );
+            INSERT INTO positions
+                (asset_id, market, side, size_usdc, average_price,
+                 realized_pnl, opened_at, updated_at)
+            VALUES
+                ('token_legacy', '0xm', 'BUY', 25.0, 0.5, 1.5,
+                 '2026-08-01 00:00:00.000000', '2026-08-01 00:00:00.000000');
+            INSERT INTO trades
+                (asset_id, market, action, price, amount_usdc, simulated,
+                 realized_pnl, reason, created_at)
+            VALUES
+                ('token_legacy', '0xm', 'BUY', 0.5, 25.0, 1,
+                 NULL, 'seed', '2026-08-01 00:00:00.000000');
+            """
+        )
+        conn.commit()
+        conn.close()
+        return str(path)
+
+    def test_legacy_db_migrated_on_init(self, legacy_db_path):
+        """旧スキーマのDBでもクラッシュせず起動し、データが引き継がれること"""
+        db = DatabaseManager(db_path=legacy_db_path)
+
+        pos = db.get_position("token_legacy")
+        assert pos is not None
+        assert pos.size_usdc == pytest.approx(25.0)
+        assert pos.average_price == pytest.approx(0.5)
+        assert pos.realized_pnl == pytest.approx(1.5)
+
+        trades = db.get_trades_since(
+            datetime(2026, 7, 1, tzinfo=timezone.utc)
+        )
+        assert len(trades) == 1
+        assert trades[0].price == pytest.approx(0.5)
+        assert trades[0].realized_pnl is None
+
+    def test_migrated_db_accepts_new_writes(self, legacy_db_path):
+        """移行後のテーブルに新コードのINSERTが通ること（旧NOT NULL列の除去）"""
+        db = DatabaseManager(db_path=legacy_db_path)
+
+        trade_id = db.save_trade(
+            asset_id="token_new",
+            market="0xm",
+            action="BUY",
+            price=0.6,
+            amount_usdc=10.0,
+        )
+        assert trade_id > 0
+
+        db.save_position(
+            asset_id="token_new", market="0xm", side="BUY",
+            size_usdc=10.0, average_price=0.6,
+        )
+        assert db.get_position("token_new").size_usdc == pytest.approx(10.0)
+
+    def test_new_db_not_affected(self, tmp_path):
+        """新規DBでは移行がスキップされ通常どおり動作すること"""
+        db = DatabaseManager(db_path=str(tmp_path / "fresh.db"))
+        assert db.get_all_positions() == []
+
+
+class TestCrossProcessVisibility:
+    """別プロセス（webプロセス相当）からの変更検知テスト
+
+    同じDBファイルを開いた2つの DatabaseManager で、web API の
+    panic_close に相当する外部変更がミラー/カウンタへ反映されること。
+    """
+
+    def test_external_delete_invalidates_mirror(self, tmp_path):
+        """他インスタンスの delete_position がミラーに反映されること"""
+        path = str(tmp_path / "shared.db")
+        bot_db = DatabaseManager(db_path=path)
+        web_db = DatabaseManager(db_path=path)
+
+        bot_db.save_position(
+            asset_id="token_x", market="0xm", side="BUY",
+            size_usdc=50.0, average_price=0.5,
+        )
+        # webプロセス側に反映されてから panic_close 相当の削除
+        assert web_db.get_position("token_x") is not None
+        web_db.delete_position("token_x")
+
+        assert bot_db.get_position("token_x") is None
+        assert bot_db.get_total_position_usdc() == pytest.approx(0.0)
+        assert bot_db.get_all_positions() == []
+
+    def test_external_save_visible(self, tmp_path):
+        """他インスタンスの save_position が読めること"""
+        path = str(tmp_path / "shared.db")
+        bot_db = DatabaseManager(db_path=path)
+        web_db = DatabaseManager(db_path=path)
+
+        bot_db.save_position(
+            asset_id="token_y", market="0xm", side="BUY",
+            size_usdc=10.0, average_price=0.4,
+        )
+        pos = web_db.get_position("token_y")
+        assert pos is not None
+        assert pos.size_usdc == pytest.approx(10.0)
+
+    def test_external_trades_refresh_daily_counters(self, tmp_path):
+        """他インスタンスの save_trade 後に日次カウンタが更新されること"""
+        path = str(tmp_path / "shared.db")
+        bot_db = DatabaseManager(db_path=path)
+        web_db = DatabaseManager(db_path=path)
+
+        bot_db.save_trade(
+            asset_id="token_z", market="0xm", action="SELL",
+            price=0.6, amount_usdc=10.0, realized_pnl=2.0,
+        )
+        # webプロセス相当: 初回のコールドスタートSUM
+        assert web_db.get_daily_pnl() == pytest.approx(2.0)
+        assert web_db.get_daily_trade_count() == 1
+
+        # bot が取引を続けたらキャッシュ済みでも追従すること
+        bot_db.save_trade(
+            asset_id="token_z", market="0xm", action="SELL",
+            price=0.6, amount_usdc=10.0, realized_pnl=-0.5,
+        )
+        assert web_db.get_daily_pnl() == pytest.approx(1.5)
+        assert web_db.get_daily_trade_count() == 2
@@ -0,0 +1,68 @@
+"""ParallelBacktestOrchestrator テスト"""
+import pytest
+
+from backtester.parallel_orchestrator import ParallelBacktestOrchestrator
+
+
+def _hold_strategy(data):
+    return {"action": "HOLD", "amount": 0, "reason": "hold"}
+
+
+def _buy_low_strategy(data):
+    if data["price"] < 0.30 and data.get("position_usdc", 0.0) == 0.0:
+        return {"action": "BUY", "amount": 10.0, "reason": "buy"}
+    return {"action": "HOLD", "amount": 0, "reason": "hold"}
+
+
+def _make_ticks(asset_id, prices):
+    return [
+        {
+            "asset_id": asset_id,
+            "market": "0xabc",
+            "price": p,
+            "best_bid": None,
+            "best_ask": None,
+            "timestamp": f"2026-02-14T10:0{i}:00Z",
+        }
+        for i, p in enumerate(prices)
+    ]
+
+
+class TestRunMany:
+    def test_per_asset_results(self):
+        orchestrator = ParallelBacktestOrchestrator(max_workers=2)
+        configs = [{"calculate_signal": _hold_strategy, "label": "hold"}]
+        ticks_by_asset = {
+            "asset1": _make_ticks("asset1", [0.50, 0.60]),
+            "asset2": _make_ticks("asset2", [0.40, 0.45]),
+        }
+
+        combined = orchestrator.run_many(configs, ticks_by_asset)
+
+        assert set(combined["results"]) == {"hold/asset1", "hold/asset2"}
+        assert combined["total_initial_capital"] == 20000.0
+        assert combined["total_final_capital"] == 20000.0
+
+    def test_parameter_sweep(self):
+        orchestrator = ParallelBacktestOrchestrator(max_workers=2)
+        configs = [
+            {"calculate_signal": _hold_strategy, "label": "hold"},
+            {"calculate_signal": _buy_low_strategy, "label": "buylow"},
+        ]
+        ticks_by_asset = {
+            "asset1": _make_ticks("asset1", [0.20, 0.40]),
+        }
+
+        combined = orchestrator.run_many(configs, ticks_by_asset)
+
+        assert len(combined["results"]) == 2
+        assert combined["results"]["hold/asset1"]["final_capital"] == 10000.0
+        # buylow: 0.20 で BUY 10 → 0.40 で強制クローズ → pnl 10
+        assert combined["results"]["buylow/asset1"]["final_capital"] == pytest.approx(
+            10010.0, abs=0.01
+        )
+
+    def test_empty_jobs(self):
+        orchestrator = ParallelBacktestOrchestrator(max_workers=1)
+        combined = orchestrator.run_many([], {})
+        assert combined["results"] == {}
@@ -20,9 +20,9 @@ class TestPriceMonitor:
         asset_id = sample_book_event["asset_id"]
         ob = monitor.get_orderbook(asset_id)
         assert ob is not None
-        assert len(ob["bids"]) == 2
-        assert len(ob["asks"]) == 2
-        assert ob["bids"][0]["price"] == "0.50"
+        assert len(ob.bids) == 2
+        assert len(ob.asks) == 2
+        assert ob.bids[0]["price"] == "0.50"
 
     @pytest.mark.asyncio
     async def test_handle_price_change_wrapper(self, monitor, sample_price_change_event):